@@ -138,6 +138,9 @@ a = Analysis(
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    # Bytecode is compiled at build time with -OO (no asserts, no docstrings);
+    # nothing in wms reads __doc__ at runtime.
+    optimize=2,
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
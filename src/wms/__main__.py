@@ -38,10 +38,12 @@ if __name__ == "__main__" and (not __package__ or __package__ == ""):
 # Fix Unicode encoding for Windows console BEFORE any imports
 if sys.platform == "win32":
     os.environ["PYTHONIOENCODING"] = "utf-8"
-    if hasattr(sys.stdout, "reconfigure"):
-        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
-    if hasattr(sys.stderr, "reconfigure"):
-        sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+    # Skip streams that are already UTF-8 (e.g. Windows "Beta: UTF-8" locale)
+    for _stream in (sys.stdout, sys.stderr):
+        if hasattr(_stream, "reconfigure") and (
+            (_stream.encoding or "").lower().replace("-", "") != "utf8"
+        ):
+            _stream.reconfigure(encoding="utf-8", errors="replace")
 
 
 def main() -> int:
@@ -47,6 +47,8 @@ class Config:
     secret_key: str
     update_check_url: str = "https://api.github.com/repos/SeikoP/Bang_tinh/releases/latest"
     desktop_installer_pattern: str = "BangTinhSetup"
+    # Watchdog + health checks; off for tests/CLI runs (APP_BOOTSTRAP_MINIMAL=1)
+    enable_background_services: bool = True
 
     @classmethod
     def from_env(cls) -> "Config":
@@ -110,6 +112,7 @@ class Config:
             desktop_installer_pattern=os.getenv(
                 "DESKTOP_INSTALLER_PATTERN", "BangTinhSetup"
             ),
+            enable_background_services=os.getenv("APP_BOOTSTRAP_MINIMAL", "0") != "1",
         )
 
     def validate(self) -> list[str]:
@@ -59,12 +59,12 @@ BANK_PACKAGE_MAP = {
 }
 
 # Set of all bank package names (for fast lookup/filtering)
-BANK_PACKAGES = set(BANK_PACKAGE_MAP.keys())
+BANK_PACKAGES = frozenset(BANK_PACKAGE_MAP)
 
 # SMS / Messaging apps — bank transaction alerts often arrive as SMS,
 # not from the bank app itself.  Adding these ensures SMS-based alerts
 # are forwarded to the PC (content filtering happens in bank_parser).
-SMS_PACKAGES = {
+SMS_PACKAGES = frozenset({
     "com.android.mms",                      # AOSP / Generic Android
     "com.android.messaging",               # AOSP Messaging (many OEMs)
     "com.google.android.apps.messaging",   # Google Messages
@@ -76,10 +76,10 @@ SMS_PACKAGES = {
     "com.coloros.mms",                     # ColorOS (OPPO/Realme)
     "com.realme.messaging",                # Realme
     "com.asus.message",                    # Asus
-}
+})
 
 # Extra fintech / e-wallet packages not covered in BANK_PACKAGE_MAP
-FINTECH_PACKAGES = {
+FINTECH_PACKAGES = frozenset({
     "vn.com.vng.zalopay",                  # ZaloPay
     "com.shopee.vn",                       # ShopeePay (Vietnam)
     "com.teko.grabpay.vn",                 # GrabPay Vietnam
@@ -89,15 +89,15 @@ FINTECH_PACKAGES = {
     "com.viettel.money",                   # Viettel Money
     "com.viettelpay",                      # Viettel Pay
     "com.momo.vnpt",                       # VNPT Money
-}
+})
 
 # Test package names (for development/testing)
-TEST_PACKAGES = {
+TEST_PACKAGES = frozenset({
     "com.test.bankapp",
     "com.example.notification",
     "com.banknotifier",  # Self-test notifications from Bank Notifier app
     "android",  # For adb test notifications
-}
+})
 
 # Combined set for notification filtering
 ALL_BANK_PACKAGES = BANK_PACKAGES | SMS_PACKAGES | FINTECH_PACKAGES | TEST_PACKAGES
@@ -91,6 +91,10 @@ class Container:
         """Register a singleton service instance"""
         self._singletons[name] = instance
 
+    def register_many(self, instances: Dict[str, Any]) -> None:
+        """Register several singleton service instances at once"""
+        self._singletons.update(instances)
+
     def register_factory(self, name: str, factory: callable) -> None:
         """Register a factory function for creating service instances"""
         self._services[name] = factory
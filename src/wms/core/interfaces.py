@@ -5,7 +5,7 @@ Defines abstract base classes for dependency injection and clean architecture.
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from .models import Product, SessionData, SessionHistory
@@ -72,6 +72,11 @@ class ISessionRepository(ABC):
         """Update handover/closing quantities"""
         pass
 
+    @abstractmethod
+    def update_qty_bulk(self, rows: List[Tuple[int, int, int]]) -> int:
+        """Update (product_id, handover, closing) rows in one transaction"""
+        pass
+
     @abstractmethod
     def reset_all(self) -> bool:
         """Reset all quantities to 0"""
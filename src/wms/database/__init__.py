@@ -2,7 +2,7 @@
 Database package - Quản lý kết nối và truy vấn SQLite
 """
 
-from .connection import get_connection, init_db
+from .connection import get_connection, init_db, init_db_async, wait_ready
 from .models import (BankNotification, Product, QuickPrice, SessionData,
                      SessionHistory, StockChangeLog)
 from .repositories import (BankRepository, HistoryRepository,
@@ -12,6 +12,8 @@ from .repositories import (BankRepository, HistoryRepository,
 __all__ = [
     "get_connection",
     "init_db",
+    "init_db_async",
+    "wait_ready",
     "Product",
     "SessionData",
     "SessionHistory",
@@ -3,6 +3,7 @@ Database connection management với context manager and connection pooling
 """
 
 import sqlite3
+import threading
 from contextlib import contextmanager
 from typing import Generator
 
@@ -26,6 +27,52 @@ def _ensure_pool_initialized():
         _pool_initialized = True
 
 
+# Cleared while init_db_async() is building the schema; queries wait on it
+_db_ready = threading.Event()
+_db_ready.set()
+_init_thread = None
+_init_error = None
+
+
+def init_db_async(after=None) -> threading.Thread:
+    """
+    Chạy init_db() (và `after`, ví dụ migrations) trên background thread.
+    Các truy vấn từ thread khác sẽ chờ cho tới khi schema sẵn sàng.
+    """
+    global _init_thread, _init_error
+
+    def _run():
+        global _init_error
+        try:
+            init_db()
+            if after is not None:
+                after()
+        except Exception as e:
+            _init_error = e
+        finally:
+            _db_ready.set()
+
+    _init_error = None
+    _db_ready.clear()
+    _init_thread = threading.Thread(target=_run, name="db-init", daemon=True)
+    _init_thread.start()
+    return _init_thread
+
+
+def wait_ready(timeout=None) -> bool:
+    """
+    Chờ init_db_async() hoàn tất.
+    Raise lại lỗi khởi tạo nếu có; trả về False nếu hết timeout.
+    """
+    if threading.current_thread() is _init_thread:
+        return True
+    if not _db_ready.wait(timeout):
+        return False
+    if _init_error is not None:
+        raise _init_error
+    return True
+
+
 @contextmanager
 def get_connection() -> Generator[sqlite3.Connection, None, None]:
     """
@@ -38,6 +85,8 @@ def get_connection() -> Generator[sqlite3.Connection, None, None]:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM products")
     """
+    if not _db_ready.is_set():
+        wait_ready()
     _ensure_pool_initialized()
 
     # Use pooled connection
@@ -371,13 +371,20 @@ class MigrationManager:
         conn.commit()
 
     def get_current_version(self) -> int:
-        """Get current database version"""
-        with sqlite3.connect(self.db_path) as conn:
-            self._ensure_schema_version_table(conn)
-            cursor = conn.cursor()
-            cursor.execute("SELECT MAX(version) FROM schema_version")
-            result = cursor.fetchone()
-            return result[0] if result[0] is not None else 0
+        """Get current database version
+
+        Read-only: a missing schema_version table means version 0. The table
+        is created by migrate() only when there is something to apply, so an
+        up-to-date database is never opened for writing at startup.
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            result = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+        except sqlite3.OperationalError:
+            return 0
+        finally:
+            conn.close()
+        return result[0] if result[0] is not None else 0
 
     def migrate(
         self, target_version: int = None, logger: logging.Logger = None
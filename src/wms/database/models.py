@@ -7,7 +7,7 @@ from datetime import date, datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     """Đại diện cho một sản phẩm"""
 
@@ -56,7 +56,7 @@ class Product:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionData:
     """Dữ liệu phiên làm việc hiện tại cho một sản phẩm"""
 
@@ -95,7 +95,7 @@ class SessionData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionHistoryItem:
     """Chi tiết một sản phẩm trong lịch sử phiên"""
 
@@ -128,7 +128,7 @@ class SessionHistoryItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionHistory:
     """Lịch sử một phiên làm việc"""
 
@@ -152,7 +152,7 @@ class SessionHistory:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class QuickPrice:
     """Đại diện cho một mục trong bảng giá nhanh"""
 
@@ -165,7 +165,7 @@ class QuickPrice:
         return cls(id=row["id"], name=row["name"], price=row["price"])
 
 
-@dataclass
+@dataclass(slots=True)
 class BankNotification:
     """Lịch sử thông báo ngân hàng"""
 
@@ -190,7 +190,7 @@ class BankNotification:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StockChangeLog:
     """Lịch sử thay đổi số lượng kho"""
 
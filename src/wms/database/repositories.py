@@ -4,7 +4,7 @@ Implements core interfaces with proper error handling and transaction management
 """
 
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from ..core.exceptions import DatabaseError, ValidationError
 from ..core.interfaces import (IHistoryRepository, IProductRepository,
@@ -214,6 +214,28 @@ class SessionRepository(ISessionRepository):
         except Exception as e:
             raise DatabaseError(f"Failed to update quantities: {str(e)}", "update_qty")
 
+    @staticmethod
+    def update_qty_bulk(rows: List[Tuple[int, int, int]]) -> int:
+        """Cập nhật nhiều dòng (product_id, handover, closing) trong một transaction
+
+        Rows must already be validated (non-negative, closing <= handover).
+        """
+        if not rows:
+            return 0
+        try:
+            with get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    """INSERT OR REPLACE INTO session_data (product_id, handover_qty, closing_qty)
+                       VALUES (?, ?, ?)""",
+                    rows,
+                )
+                return len(rows)
+        except Exception as e:
+            raise DatabaseError(
+                f"Failed to update quantities: {str(e)}", "update_qty_bulk"
+            )
+
     @staticmethod
     def reset_all() -> bool:
         """Reset tất cả số lượng về 0"""
@@ -461,6 +483,19 @@ class BankRepository:
             )
             return [BankNotification.from_row(row) for row in cursor.fetchall()]
 
+    @staticmethod
+    def get_recent(limit: int = 100) -> List[tuple]:
+        """Lấy các dòng mới nhất trước, dạng tuple thô cho UI:
+        (id, time_str, source, amount, sender_name, content)"""
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """SELECT id, time_str, source, amount, COALESCE(sender_name, ''), content
+                   FROM bank_history ORDER BY id DESC LIMIT ?""",
+                (limit,),
+            )
+            return [tuple(row) for row in cursor.fetchall()]
+
     @staticmethod
     def delete(id: int) -> bool:
         with get_connection() as conn:
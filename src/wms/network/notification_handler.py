@@ -2,28 +2,157 @@
 Notification Handler - HTTP request handler for Android notifications
 """
 
+import hmac
 import json
+import logging
 import time
 import threading
-from http.server import BaseHTTPRequestHandler
-from urllib.parse import parse_qs, urlparse
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote_plus
 
 from ..core.constants import ALL_BANK_PACKAGES
-from ..database.connection import get_connection
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# JSON codec for the request hot path: orjson when installed, else stdlib.
+# _dumps always returns UTF-8 bytes ready for wfile.write().
+if HAS_ORJSON:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _build_response(body: bytes, status: int = 200, reason: str = "OK") -> bytes:
+    """Precompose a complete HTTP/1.0 response so it goes out in one write"""
+    return (
+        b"HTTP/1.0 %d %s\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: %d\r\n"
+        b"Connection: close\r\n"
+        b"\r\n" % (status, reason.encode("ascii"), len(body))
+    ) + body
+
+
+# Fire-and-forget acks for the notification path (one send() each)
+_RESP_HEALTH = _build_response(b'{"status":"ok","auth":"not_checked"}')
+_RESP_FILTERED = _build_response(b'{"status":"success","message":"filtered"}')
+_RESP_RECEIVED = _build_response(b'{"status":"success","message":"received"}')
+_RESP_NO_CONTENT = _build_response(b'{"status":"success","message":"no content found"}')
+_RESP_MISSING_KEY = _build_response(
+    b'{"status":"error","message":"Unauthorized: Missing API key"}', 401, "Unauthorized"
+)
+_RESP_INVALID_KEY = _build_response(
+    b'{"status":"error","message":"Forbidden: Invalid API key"}', 403, "Forbidden"
+)
+_RESP_TOO_LARGE = _build_response(
+    b'{"status":"error","message":"Payload too large"}', 413, "Payload Too Large"
+)
+
+# Largest request body we read and parse; notifications are a few hundred bytes
+_MAX_BODY = 64 * 1024
+
+# Constant /api responses
+_RESP_API_UNAUTHORIZED = _build_response(
+    b'{"success":false,"error":"Unauthorized"}', 401, "Unauthorized"
+)
+_RESP_API_TOO_LARGE = _build_response(
+    b'{"success":false,"error":"Payload too large"}', 413, "Payload Too Large"
+)
+_RESP_SESSION_OK = {
+    action: _build_response(b'{"success":true,"action":"%s"}' % action.encode("ascii"))
+    for action in ("update", "handover", "close_shift")
+}
+
+# Immutable set bound at module level: the hot-path check is a plain name lookup
+_BANK_PACKAGES = ALL_BANK_PACKAGES
+
+
+def _query_value(query: str, name: str):
+    """First non-empty ``name`` value in a query string, like parse_qs()[name][0]
+
+    Only the matching pair is decoded; no dict of lists is built.
+    """
+    prefix = name + "="
+    for part in query.split("&"):
+        if part.startswith(prefix) and len(part) > len(prefix):
+            return unquote_plus(part[len(prefix):])
+    return None
+
+
+def _extract_content(data, fallback):
+    """Notification text from a parsed payload
+
+    ``content`` may itself be a JSON string; it is only parsed again when its
+    first character says it is an object or array, so plain-text bodies
+    (the usual bank message) skip the second decode entirely.
+    """
+    if not isinstance(data, dict):
+        return fallback
+    raw_content = data.get("content", fallback)
+    if not isinstance(raw_content, str):
+        return raw_content
+    head = raw_content[:1]
+    if head.isspace():
+        head = raw_content.lstrip()[:1]
+    if head in ("{", "["):
+        try:
+            inner = _loads(raw_content)
+        except ValueError:
+            return raw_content
+        if isinstance(inner, dict):
+            return inner.get("content", raw_content)
+    return raw_content
 
 
 class NotificationHandler(BaseHTTPRequestHandler):
     """Server xử lý thông báo từ app Android - Filter tại PC"""
 
+    # One request per connection; no keep-alive bookkeeping
+    protocol_version = "HTTP/1.0"
+
     # Bank packages imported from centralized constants
-    BANK_PACKAGES = ALL_BANK_PACKAGES
+    BANK_PACKAGES = _BANK_PACKAGES
 
-    # Rate limiting: IP -> [timestamp, count]
-    _rate_limit_store = {}
+    # Rate limiting: IP -> (tokens, last_refill) token bucket on the
+    # monotonic clock; RATE_LIMIT_MAX tokens refill over RATE_LIMIT_Window.
+    # Kept in LRU order and capped so a scan of many source IPs can't grow it
+    # without bound (an evicted IP just starts again with a full bucket).
+    _rate_limit_store = OrderedDict()
     _rate_limit_lock = threading.Lock()
+    RATE_LIMIT_MAX_KEYS = 10000
     RATE_LIMIT_Window = 60  # seconds
     RATE_LIMIT_MAX = 100    # requests per window
 
+    # API routes by exact path (query string and trailing "/" stripped) ->
+    # handler method name; any other path is a notification
+    _GET_ROUTES = {
+        # Health / probe bypass (GET only — Cloudflare tunnel probes)
+        "/": "handle_health",
+        "/health": "handle_health",
+        "/favicon.ico": "handle_health",
+        "/api/ping": "handle_ping",
+        "/api/session": "handle_get_session",
+        "/api/notes": "handle_get_notes",
+    }
+    _POST_ROUTES = {
+        "/api/session": "handle_post_session",
+        "/api/notes": "handle_post_notes",
+    }
+    # Handlers reachable without a key. POST always authenticates so the
+    # Android Ping proves auth works; /api/ping reports auth instead of failing.
+    _PUBLIC_ROUTES = frozenset({"handle_health", "handle_ping"})
+
     def _get_rate_limit_params(self):
         """Get rate limit parameters, allowing overrides from server instance"""
         window = getattr(self.server, "rate_limit_window", self.RATE_LIMIT_Window)
@@ -31,254 +160,197 @@ class NotificationHandler(BaseHTTPRequestHandler):
         return window, max_reqs
 
     def _check_rate_limit(self, ip_address):
-        """Simple token bucket rate limiting with thread safety"""
-        time_now = time.time()
+        """Token bucket rate limiting with thread safety
+
+        Each IP may burst up to ``max_reqs`` requests; tokens refill at
+        ``max_reqs / window`` per second, so there is no window-edge reset.
+        """
+        now = time.monotonic()
         window, max_reqs = self._get_rate_limit_params()
-        
+
+        store = self._rate_limit_store
         with self._rate_limit_lock:
-            # Initialize or reset if window expired
-            if ip_address not in self._rate_limit_store:
-                self._rate_limit_store[ip_address] = [time_now, 1]
-                return True
-            
-            start_time, count = self._rate_limit_store[ip_address]
-            
-            if time_now - start_time > window:
-                # Reset window
-                self._rate_limit_store[ip_address] = [time_now, 1]
+            entry = store.get(ip_address)
+            if entry is None:
+                tokens, last = max_reqs, now
+                if len(store) >= self.RATE_LIMIT_MAX_KEYS:
+                    store.popitem(last=False)
+            else:
+                tokens, last = entry
+                store.move_to_end(ip_address)
+            tokens = min(max_reqs, tokens + (now - last) * max_reqs / window)
+            if tokens >= 1:
+                store[ip_address] = (tokens - 1, now)
                 return True
-            
-            if count >= max_reqs:
-                if hasattr(self.server, "logger") and self.server.logger:
-                    self.server.logger.warning(f"Rate limit exceeded for {ip_address}")
-                return False
-                
-            self._rate_limit_store[ip_address][1] += 1
-            return True
+            store[ip_address] = (tokens, now)
+
+        logger = getattr(self.server, "logger", None)
+        if logger:
+            logger.warning("Rate limit exceeded for %s", ip_address)
+        return False
 
     def handle_request(self):
         """Handle incoming notification request"""
+        # Resolve server state once; %-style args are only formatted if emitted
+        server = self.server
+        logger = getattr(server, "logger", None)
+        info = logger is not None and logger.isEnabledFor(logging.INFO)
+        # Body/parse tracing is debug-only: it is per request and noisy
+        debug = logger is not None and logger.isEnabledFor(logging.DEBUG)
         try:
             msg = None
+            # Body dict when msg is the whole JSON body, so it is parsed only once
+            parsed = None
             # Log incoming request
-            if hasattr(self.server, "logger") and self.server.logger:
-                self.server.logger.info(
-                    f"=== Received {self.command} request to {self.path} ==="
-                )
-                self.server.logger.info(f"Headers: {dict(self.headers)}")
-
-            # --- HEALTH / PROBE bypass (GET only — Cloudflare tunnel probes) ---
-            # POST requests MUST authenticate so Android Ping proves auth works.
-            parsed_url = urlparse(self.path)
-            if self.command == "GET" and parsed_url.path in ("/", "/health", "/favicon.ico"):
-                self.send_response(200)
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                self.wfile.write(b'{"status":"ok","auth":"not_checked"}')
-                return
-
-            # --- SECURITY CHECK ---
-            expected_key = getattr(self.server, "secret_key", None)
-
-            if expected_key:
-                provided_key = self._extract_key()
-                if not provided_key:
-                    self.send_response(401)
-                    self.send_header("Content-Type", "application/json")
-                    self.end_headers()
-                    self.wfile.write(
-                        b'{"status":"error","message":"Unauthorized: Missing API key"}'
-                    )
-                    if hasattr(self.server, "logger") and self.server.logger:
-                        auth_header = self.headers.get("Authorization", "")
-                        self.server.logger.warning(
-                            f"Unauthorized (no key) from {self.client_address} "
-                            f"path={parsed_url.path} method={self.command} "
-                            f"auth_header={repr(auth_header)} "
-                            f"content_type={self.headers.get('Content-Type', 'none')}"
-                        )
-                    return
+            if info:
+                logger.info("=== Received %s request to %s ===", self.command, self.path)
+            # Full header dump is debug-only; dict() is built only when emitted
+            if debug:
+                logger.debug("Headers: %s", dict(self.headers))
 
-                if provided_key != expected_key:
-                    self.send_response(403)
-                    self.send_header("Content-Type", "application/json")
-                    self.end_headers()
-                    self.wfile.write(
-                        b'{"status":"error","message":"Forbidden: Invalid API key"}'
-                    )
-                    if hasattr(self.server, "logger") and self.server.logger:
-                        self.server.logger.warning(
-                            f"Forbidden (wrong key) from {self.client_address} path={parsed_url.path} "
-                            f"got={provided_key[:8]}... expected={expected_key[:8]}..."
-                        )
-                    return
-            # ----------------------
+            # Auth already passed in _dispatch(); most POSTs carry no query string
+            query = self.path.partition("?")[2]
 
             # 1. Thử lấy từ URL Query (?content=...)
-            parsed_url = urlparse(self.path)
-            query_params = parse_qs(parsed_url.query)
-            if hasattr(self.server, "logger") and self.server.logger:
-                self.server.logger.info(f"Query params: {query_params}")
-
-            if "content" in query_params:
-                msg = query_params["content"][0]
-                if hasattr(self.server, "logger") and self.server.logger:
-                    self.server.logger.info(f"Found content in query: {msg}")
+            if query:
+                msg = _query_value(query, "content")
+                if msg and debug:
+                    logger.debug("Found content in query: %s", msg)
 
             # 2. Nếu URL không có, thử lấy từ Body
             if not msg:
                 # If body was already read during auth key extraction, reuse it
                 _peeked = getattr(self, "_peeked_body", None)
 
-                content_length = self.headers.get("Content-Length")
+                content_length = self._content_length()
                 transfer_encoding = self.headers.get("Transfer-Encoding", "").lower()
                 content_type = self.headers.get("Content-Type", "")
-                if hasattr(self.server, "logger") and self.server.logger:
-                    self.server.logger.info(
-                        f"Content-Length: {content_length}, "
-                        f"Transfer-Encoding: {transfer_encoding}, "
-                        f"Content-Type: {content_type}"
+                if debug:
+                    logger.debug(
+                        "Content-Length: %s, Transfer-Encoding: %s, Content-Type: %s",
+                        content_length, transfer_encoding, content_type,
                     )
 
-                post_data = None
+                # Body stays bytes: the JSON parser takes bytes directly and
+                # only the raw/form fallbacks need decoded text
+                raw_body = None
                 if _peeked is not None:
                     # Body was already consumed during auth — reuse it
-                    post_data = _peeked.decode("utf-8", errors="replace")
-                elif content_length and int(content_length) > 0:
+                    raw_body = _peeked
+                elif content_length > _MAX_BODY:
+                    self.wfile.write(_RESP_TOO_LARGE)
+                    return
+                elif content_length > 0:
                     # Standard HTTP/1.1 with Content-Length
-                    raw = self.rfile.read(int(content_length))
-                    post_data = raw.decode("utf-8", errors="replace")
+                    raw_body = self.rfile.read(content_length)
                 elif "chunked" in transfer_encoding:
                     # HTTP chunked encoding — used by Cloudflare / reverse proxies
                     chunks: list[bytes] = []
+                    total = 0
                     try:
                         while True:
-                            size_line = self.rfile.readline().decode("utf-8", errors="replace").strip()
+                            size_line = self.rfile.readline().strip()
                             if not size_line:
                                 break
-                            chunk_size = int(size_line.split(";")[0], 16)
+                            chunk_size = int(size_line.split(b";")[0], 16)
                             if chunk_size == 0:
                                 break
+                            total += chunk_size
+                            if total > _MAX_BODY:
+                                self.wfile.write(_RESP_TOO_LARGE)
+                                return
                             chunk = self.rfile.read(chunk_size)
                             chunks.append(chunk)
                             self.rfile.read(2)  # consume trailing CRLF
                     except Exception:
                         pass
                     if chunks:
-                        post_data = b"".join(chunks).decode("utf-8", errors="replace")
-                if post_data is not None:
-                    if hasattr(self.server, "logger") and self.server.logger:
-                        self.server.logger.info(f"Received body: {post_data}")
+                        raw_body = b"".join(chunks)
+                if raw_body is not None:
+                    if debug:
+                        logger.debug("Received body: %r", raw_body)
 
                     # Try JSON first
                     try:
-                        data = json.loads(post_data)
-                        msg = data.get("content", post_data)
-                        if hasattr(self.server, "logger") and self.server.logger:
-                            self.server.logger.info(f"Parsed JSON, content: {msg}")
-                    except json.JSONDecodeError:
+                        data = _loads(raw_body)
+                        if isinstance(data, dict) and "content" in data:
+                            msg = data["content"]
+                        else:
+                            msg = raw_body.decode("utf-8", errors="replace")
+                            parsed = data
+                        if debug:
+                            logger.debug("Parsed JSON, content: %s", msg)
+                    except ValueError:
+                        # Not JSON (or not UTF-8): decode once for the fallbacks
+                        post_data = raw_body.decode("utf-8", errors="replace")
                         # Try form data (application/x-www-form-urlencoded)
                         if "application/x-www-form-urlencoded" in content_type:
-                            form_params = parse_qs(post_data)
-                            if "content" in form_params:
-                                msg = form_params["content"][0]
-                                if (
-                                    hasattr(self.server, "logger")
-                                    and self.server.logger
-                                ):
-                                    self.server.logger.info(
-                                        f"Parsed form data, content: {msg}"
-                                    )
+                            msg = _query_value(post_data, "content")
+                            if msg:
+                                if debug:
+                                    logger.debug("Parsed form data, content: %s", msg)
                             else:
                                 msg = post_data
                         else:
                             msg = post_data
-                            if hasattr(self.server, "logger") and self.server.logger:
-                                self.server.logger.info(
-                                    f"Not JSON/form, using raw body: {msg}"
-                                )
+                            if debug:
+                                logger.debug("Not JSON/form, using raw body: %s", msg)
 
             # Process message BEFORE sending response to ensure it's handled
             if msg:
                 # Try to parse as JSON to get package info
-                package_name = None
-                content = msg
-                try:
-                    data = json.loads(msg)
-                    if isinstance(data, dict):
-                        package_name = data.get("package")
-                        # Get content - might be nested JSON string
-                        raw_content = data.get("content", msg)
-
-                        # Only try to parse content if it looks like JSON (starts with { or [)
-                        if isinstance(
-                            raw_content, str
-                        ) and raw_content.strip().startswith(("{", "[")):
-                            try:
-                                content_data = json.loads(raw_content)
-                                if isinstance(content_data, dict):
-                                    # Extract actual content from nested structure
-                                    content = content_data.get("content", raw_content)
-                                else:
-                                    content = raw_content
-                            except (json.JSONDecodeError, TypeError):
-                                content = raw_content
-                        else:
-                            content = raw_content
-                except (json.JSONDecodeError, TypeError):
-                    pass
-
-                # Filter by package name (PC-side filtering)
-                if package_name:
-                    if package_name not in self.BANK_PACKAGES:
-                        if hasattr(self.server, "logger") and self.server.logger:
-                            self.server.logger.debug(
-                                f"Filtered out notification from: {package_name}"
-                            )
-                        # Send response for filtered notification
-                        self.send_response(200)
-                        self.send_header("Content-Type", "application/json")
-                        self.end_headers()
-                        self.wfile.write(b'{"status":"success","message":"filtered"}')
-                        return
-
-                    if hasattr(self.server, "logger") and self.server.logger:
-                        self.server.logger.info(
-                            f"Accepted notification from: {package_name}"
-                        )
+                if parsed is not None:
+                    data = parsed
+                else:
+                    try:
+                        data = _loads(msg)
+                    except (ValueError, TypeError):
+                        # TypeError: content was not a string (stdlib json)
+                        data = None
+
+                package_name = data.get("package") if isinstance(data, dict) else None
+                # Filter by package name (PC-side filtering) before any
+                # nested parsing or logging of the content
+                if package_name and package_name not in _BANK_PACKAGES:
+                    if logger:
+                        logger.debug("Filtered out notification from: %s", package_name)
+                    self.wfile.write(_RESP_FILTERED)
+                    return
+
+                content = _extract_content(data, msg)
+
+                if package_name and info:
+                    logger.info("Accepted notification from: %s", package_name)
 
                 # Đẩy lên giao diện TRƯỚC KHI gửi response
-                if hasattr(self.server, "logger") and self.server.logger:
-                    self.server.logger.info(
-                        f"Processing notification: {content[:100]}..."
-                    )
-                if getattr(self.server, "signal", None):
-                    self.server.signal.emit(str(content))
-                    if hasattr(self.server, "logger") and self.server.logger:
-                        self.server.logger.info("Signal emitted successfully")
+                if info:
+                    logger.info("Processing notification: %.100s...", content)
+                signal = getattr(server, "signal", None)
+                if signal:
+                    signal.emit(str(content))
+                    if info:
+                        logger.info("Signal emitted successfully")
                 
                 # Gửi response SAU KHI đã xử lý
-                self.send_response(200)
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                self.wfile.write(b'{"status":"success","message":"received"}')
+                self.wfile.write(_RESP_RECEIVED)
             else:
                 # No content found
-                self.send_response(200)
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                self.wfile.write(b'{"status":"success","message":"no content found"}')
-                if hasattr(self.server, "logger") and self.server.logger:
-                    self.server.logger.warning("No content found in request")
+                self.wfile.write(_RESP_NO_CONTENT)
+                if logger:
+                    logger.warning("No content found in request")
 
         except Exception as e:
-            if hasattr(self.server, "logger") and self.server.logger:
-                self.server.logger.error(f"Error handling request: {e}", exc_info=True)
+            if logger:
+                logger.error("Error handling request: %s", e, exc_info=True)
             try:
-                self.send_response(500)
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                self.wfile.write(f'{{"status":"error","message":"{str(e)}"}}'.encode())
+                # _dumps escapes quotes/newlines in the exception text
+                self.wfile.write(
+                    _build_response(
+                        _dumps({"status": "error", "message": str(e)}),
+                        500,
+                        "Internal Server Error",
+                    )
+                )
             except:
                 pass
 
@@ -293,26 +365,14 @@ class NotificationHandler(BaseHTTPRequestHandler):
 
     def do_GET(self):
         """Handle GET requests"""
-        # Check rate limit first for ALL requests
-        if not self._check_rate_limit(self.client_address[0]):
-            self.send_error(429, "Too Many Requests")
-            return
-
-        # Track device activity for connection status
-        self._touch_heartbeat()
-
-        parsed = urlparse(self.path)
-        if parsed.path == "/api/ping":
-            self.handle_ping()
-        elif self.path.startswith("/api/session"):
-            self.handle_get_session()
-        elif self.path.startswith("/api/notes"):
-            self.handle_get_notes()
-        else:
-            self.handle_request()  # Default notification handling
+        self._dispatch(self._GET_ROUTES)
 
     def do_POST(self):
         """Handle POST requests"""
+        self._dispatch(self._POST_ROUTES)
+
+    def _dispatch(self, routes):
+        """Rate limit, authenticate once, then run the handler for the path"""
         # Check rate limit first for ALL requests
         if not self._check_rate_limit(self.client_address[0]):
             self.send_error(429, "Too Many Requests")
@@ -321,12 +381,52 @@ class NotificationHandler(BaseHTTPRequestHandler):
         # Track device activity for connection status
         self._touch_heartbeat()
 
-        if self.path.startswith("/api/session"):
-            self.handle_post_session()
-        elif self.path.startswith("/api/notes"):
-            self.handle_post_notes()
+        # Default: notification handling
+        path = self.path.partition("?")[0]
+        if len(path) > 1:
+            path = path.rstrip("/") or "/"
+        route = routes.get(path, "handle_request")
+        if route not in self._PUBLIC_ROUTES and not self._authorize(route):
+            return
+        getattr(self, route)()
+
+    def _authorize(self, route):
+        """Check the key once per request; on failure write the rejection
+
+        /api clients get a plain 401; the notification path keeps its
+        401 (no key) / 403 (wrong key) distinction.
+        """
+        if not self.server.auth_enabled:
+            return True
+        provided_key = self._extract_key()
+        if provided_key and self._key_matches(provided_key):
+            return True
+
+        logger = getattr(self.server, "logger", None)
+        path = self.path.partition("?")[0]
+        if route != "handle_request":
+            self.wfile.write(_RESP_API_UNAUTHORIZED)
+            if logger:
+                logger.warning("Auth failed for %s %s", self.command, path)
+        elif not provided_key:
+            self.wfile.write(_RESP_MISSING_KEY)
+            if logger:
+                logger.warning(
+                    "Unauthorized (no key) from %s path=%s method=%s "
+                    "auth_header=%r content_type=%s",
+                    self.client_address, path, self.command,
+                    self.headers.get("Authorization", ""),
+                    self.headers.get("Content-Type", "none"),
+                )
         else:
-            self.handle_request()
+            self.wfile.write(_RESP_INVALID_KEY)
+            if logger:
+                logger.warning(
+                    "Forbidden (wrong key) from %s path=%s got=%.8s... expected=%.8s...",
+                    self.client_address, path, provided_key,
+                    self.server.secret_key,
+                )
+        return False
 
     def _extract_key(self):
         """Extract auth key from Bearer header, ?key= query param, or JSON body."""
@@ -335,30 +435,54 @@ class NotificationHandler(BaseHTTPRequestHandler):
         if auth_header.startswith("Bearer "):
             return auth_header[7:].strip()
         # 2. Fallback: ?key=<key> query param (legacy / simple devices)
-        parsed = urlparse(self.path)
-        params = parse_qs(parsed.query)
-        if "key" in params:
-            return params["key"][0]
+        query = self.path.partition("?")[2]
+        if query:
+            key = _query_value(query, "key")
+            if key:
+                return key
         # 3. Fallback: "key" field in JSON body (Android may send key this way)
         if self.command == "POST":
             try:
-                content_length = self.headers.get("Content-Length")
-                if content_length and 0 < int(content_length) <= 10240:
-                    raw = self.rfile.read(int(content_length))
+                content_length = self._content_length()
+                if 0 < content_length <= 10240:
+                    raw = self.rfile.read(content_length)
                     self._peeked_body = raw  # store for later reuse
-                    body_data = json.loads(raw.decode("utf-8", errors="replace"))
+                    body_data = _loads(raw)
                     if isinstance(body_data, dict) and "key" in body_data:
                         return str(body_data["key"]).strip()
             except Exception:
                 pass
         return ""
 
+    def _content_length(self):
+        """Content-Length header as int (0 if missing or malformed)"""
+        try:
+            return int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            return 0
+
+    def _read_body(self, content_length):
+        """Read the body, reusing the copy _extract_key() already consumed"""
+        peeked = getattr(self, "_peeked_body", None)
+        if peeked is not None:
+            return peeked
+        return self.rfile.read(content_length)
+
+    def _key_matches(self, provided_key):
+        """Constant-time key comparison (no timing leak of the key prefix)"""
+        return hmac.compare_digest(
+            provided_key.encode("utf-8"), self.server.secret_key_bytes
+        )
+
+    def handle_health(self):
+        """Liveness probe; needs no key"""
+        self.wfile.write(_RESP_HEALTH)
+
     def _check_auth(self):
         """Helper to enforce auth — supports Bearer header AND ?key= param."""
-        expected_key = getattr(self.server, "secret_key", None)
-        if not expected_key:
+        if not self.server.auth_enabled:
             return True
-        return self._extract_key() == expected_key
+        return self._key_matches(self._extract_key())
 
     def handle_ping(self):
         """API: Real connectivity check — tests auth, DB access, signal readiness."""
@@ -403,28 +527,15 @@ class NotificationHandler(BaseHTTPRequestHandler):
         self.send_response(200 if all_ok else 503)
         self.send_header("Content-Type", "application/json")
         self.end_headers()
-        self.wfile.write(json.dumps(result).encode("utf-8"))
+        self.wfile.write(_dumps(result))
 
     def handle_get_session(self):
         """API: Get current session data"""
+        logger = getattr(self.server, "logger", None)
         try:
             # Log request
-            if hasattr(self.server, "logger") and self.server.logger:
-                self.server.logger.info(f"GET /api/session from {self.client_address}")
-
-            # Check auth
-            if not self._check_auth():
-                if hasattr(self.server, "logger") and self.server.logger:
-                    self.server.logger.warning("Auth failed for /api/session")
-                self.send_response(401)
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                self.wfile.write(
-                    json.dumps({"success": False, "error": "Unauthorized"}).encode(
-                        "utf-8"
-                    )
-                )
-                return
+            if logger:
+                logger.info("GET /api/session from %s", self.client_address)
 
             container = getattr(self.server, "container", None)
             if not container:
@@ -434,65 +545,59 @@ class NotificationHandler(BaseHTTPRequestHandler):
             if not repo:
                 raise Exception("Session repository not found")
 
-            sessions = repo.get_all()
-            data = []
-            for s in sessions:
-                data.append(
-                    {
-                        "product_id": s.product.id,
-                        "product_name": s.product.name,
-                        "large_unit": s.product.large_unit,
-                        "conversion": s.product.conversion,
-                        "unit_price": float(s.product.unit_price),
-                        "unit_char": s.product.unit_char,
-                        "handover_qty": s.handover_qty,
-                        "closing_qty": s.closing_qty,
-                        "used_qty": s.used_qty,
-                        "amount": float(s.amount),
-                    }
-                )
+            # unit_price is a REAL column, so it (and amount) are already floats
+            # "for p in (s.product,)" binds each row's product once
+            data = [
+                {
+                    "product_id": p.id,
+                    "product_name": p.name,
+                    "large_unit": p.large_unit,
+                    "conversion": p.conversion,
+                    "unit_price": p.unit_price,
+                    "unit_char": p.unit_char,
+                    "handover_qty": s.handover_qty,
+                    "closing_qty": s.closing_qty,
+                    "used_qty": s.used_qty,
+                    "amount": s.amount,
+                }
+                for s in repo.get_all()
+                for p in (s.product,)
+            ]
 
             response = {"success": True, "session": data}
 
-            if hasattr(self.server, "logger") and self.server.logger:
-                self.server.logger.info(f"Returning {len(data)} session items")
+            if logger:
+                logger.info("Returning %d session items", len(data))
 
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode("utf-8"))
+            self.wfile.write(_build_response(_dumps(response)))
 
         except Exception as e:
-            if hasattr(self.server, "logger") and self.server.logger:
-                self.server.logger.error(f"API Error (GET session): {e}", exc_info=True)
+            if logger:
+                logger.error("API Error (GET session): %s", e, exc_info=True)
             self.send_response(500)
             self.send_header("Content-Type", "application/json")
             self.end_headers()
-            self.wfile.write(
-                json.dumps({"success": False, "error": str(e)}).encode("utf-8")
-            )
+            self.wfile.write(_dumps({"success": False, "error": str(e)}))
 
     def handle_post_session(self):
         """API: Update session data"""
-        if not self._check_auth():
-            self.send_response(401)
-            self.end_headers()
-            return
-
+        logger = getattr(self.server, "logger", None)
         try:
-            content_length = int(self.headers.get("Content-Length", 0))
+            content_length = self._content_length()
             if content_length == 0:
                 raise Exception("Empty body")
+            if content_length > _MAX_BODY:
+                self.wfile.write(_RESP_API_TOO_LARGE)
+                return
 
-            post_data = self.rfile.read(content_length).decode("utf-8")
-            payload = json.loads(post_data)
+            payload = _loads(self._read_body(content_length))
             updates = payload.get("updates", [])
             action = payload.get("action", "update")  # "handover", "close_shift", or "update"
             notes = payload.get("notes", "")
             shift_name = (payload.get("shift_name") or "").strip()
 
-            if hasattr(self.server, "logger") and self.server.logger:
-                self.server.logger.info(f"POST /api/session - action: {action}, updates: {len(updates)}")
+            if logger:
+                logger.info("POST /api/session - action: %s, updates: %d", action, len(updates))
 
             container = getattr(self.server, "container", None)
             if not container:
@@ -508,30 +613,26 @@ class NotificationHandler(BaseHTTPRequestHandler):
             current_sessions = {s.product.id: s for s in repo.get_all()}
 
             def apply_updates(update_list):
-                with get_connection() as conn:
-                    cursor = conn.cursor()
-                    for update in update_list:
-                        pid = update.get("product_id")
-                        if pid not in current_sessions:
-                            continue
-
-                        current = current_sessions[pid]
-                        handover = update.get("handover_qty", current.handover_qty)
-                        closing = update.get("closing_qty", current.closing_qty)
-                        # Validate
-                        if handover < 0:
-                            handover = 0
-                        if closing < 0:
-                            closing = 0
-                        if closing > handover:
-                            closing = handover
-                        cursor.execute(
-                            """INSERT OR REPLACE INTO session_data (product_id, handover_qty, closing_qty)
-                               VALUES (?, ?, ?)""",
-                            (pid, handover, closing),
-                        )
-                        current.handover_qty = handover
-                        current.closing_qty = closing
+                rows = []
+                for update in update_list:
+                    pid = update.get("product_id")
+                    if pid not in current_sessions:
+                        continue
+
+                    current = current_sessions[pid]
+                    handover = update.get("handover_qty", current.handover_qty)
+                    closing = update.get("closing_qty", current.closing_qty)
+                    # Validate
+                    if handover < 0:
+                        handover = 0
+                    if closing < 0:
+                        closing = 0
+                    if closing > handover:
+                        closing = handover
+                    rows.append((pid, handover, closing))
+                    current.handover_qty = handover
+                    current.closing_qty = closing
+                repo.update_qty_bulk(rows)
 
             if action == "handover":
                 # Save current session history BEFORE applying handover
@@ -541,33 +642,30 @@ class NotificationHandler(BaseHTTPRequestHandler):
                         history_repo.save_current_session(
                             shift_name or "Giao ca (Android)", notes
                         )
-                        if hasattr(self.server, "logger") and self.server.logger:
-                            self.server.logger.info(
-                                f"Handover: Saved history as '{shift_name or 'Giao ca (Android)'}'"
+                        if logger:
+                            logger.info(
+                                "Handover: Saved history as '%s'",
+                                shift_name or "Giao ca (Android)",
                             )
                     except Exception as hist_err:
-                        if hasattr(self.server, "logger") and self.server.logger:
-                            self.server.logger.warning(f"Failed to save history before handover: {hist_err}")
+                        if logger:
+                            logger.warning("Failed to save history before handover: %s", hist_err)
 
                 # Giao ca: closing_qty becomes new handover_qty, reset closing to 0
-                with get_connection() as conn:
-                    cursor = conn.cursor()
-                    for update in updates:
-                        pid = update.get("product_id")
-                        if pid not in current_sessions:
-                            continue
-
-                        current = current_sessions[pid]
-                        closing = update.get("closing_qty", current.closing_qty)
-
-                        # New handover = current closing (what's left for next shift)
-                        cursor.execute(
-                            """INSERT OR REPLACE INTO session_data (product_id, handover_qty, closing_qty)
-                               VALUES (?, ?, ?)""",
-                            (pid, closing, 0),
-                        )
-                        if hasattr(self.server, "logger") and self.server.logger:
-                            self.server.logger.info(f"Handover: Product {pid} - new handover={closing}, closing=0")
+                rows = []
+                for update in updates:
+                    pid = update.get("product_id")
+                    if pid not in current_sessions:
+                        continue
+
+                    current = current_sessions[pid]
+                    closing = update.get("closing_qty", current.closing_qty)
+
+                    # New handover = current closing (what's left for next shift)
+                    rows.append((pid, closing, 0))
+                    if logger:
+                        logger.info("Handover: Product %s - new handover=%s, closing=0", pid, closing)
+                repo.update_qty_bulk(rows)
 
             elif action == "close_shift":
                 apply_updates(updates)
@@ -576,19 +674,21 @@ class NotificationHandler(BaseHTTPRequestHandler):
                         history_repo.save_current_session(
                             shift_name or "Chốt ca (Android)", notes
                         )
-                        if hasattr(self.server, "logger") and self.server.logger:
-                            self.server.logger.info(
-                                f"Close shift: Saved history as '{shift_name or 'Chốt ca (Android)'}'"
+                        if logger:
+                            logger.info(
+                                "Close shift: Saved history as '%s'",
+                                shift_name or "Chốt ca (Android)",
                             )
                     except Exception as hist_err:
-                        if hasattr(self.server, "logger") and self.server.logger:
-                            self.server.logger.warning(f"Failed to save history for close shift: {hist_err}")
+                        if logger:
+                            logger.warning("Failed to save history for close shift: %s", hist_err)
 
             else:
                 apply_updates(updates)
 
             # Emit signal to refresh UI
-            if hasattr(self.server, "signal"):
+            signal = getattr(self.server, "signal", None)
+            if signal:
                 # Use special command format for system actions
                 msg = json.dumps(
                     {
@@ -598,33 +698,25 @@ class NotificationHandler(BaseHTTPRequestHandler):
                         "notes": notes,
                     }
                 )
-                self.server.signal.emit(msg)
+                signal.emit(msg)
 
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps({"success": True, "action": action}).encode("utf-8"))
+            response = _RESP_SESSION_OK.get(action)
+            if response is None:
+                response = _build_response(_dumps({"success": True, "action": action}))
+            self.wfile.write(response)
 
         except Exception as e:
-            if hasattr(self.server, "logger") and self.server.logger:
-                self.server.logger.error(f"API Error (POST session): {e}")
+            if logger:
+                logger.error("API Error (POST session): %s", e)
             self.send_response(500)
             self.send_header("Content-Type", "application/json")
             self.end_headers()
-            self.wfile.write(
-                json.dumps({"success": False, "error": str(e)}).encode("utf-8")
-            )
+            self.wfile.write(_dumps({"success": False, "error": str(e)}))
 
     def handle_get_notes(self):
         """API: Get notes/tasks"""
+        logger = getattr(self.server, "logger", None)
         try:
-            if not self._check_auth():
-                self.send_response(401)
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                self.wfile.write(json.dumps({"success": False, "error": "Unauthorized"}).encode("utf-8"))
-                return
-
             container = getattr(self.server, "container", None)
             if not container:
                 raise Exception("Container not found")
@@ -647,36 +739,31 @@ class NotificationHandler(BaseHTTPRequestHandler):
                     "notes": t.notes,
                 })
 
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps({"success": True, "notes": data}).encode("utf-8"))
+            self.wfile.write(_build_response(_dumps({"success": True, "notes": data})))
 
         except Exception as e:
-            if hasattr(self.server, "logger") and self.server.logger:
-                self.server.logger.error(f"API Error (GET notes): {e}", exc_info=True)
+            if logger:
+                logger.error("API Error (GET notes): %s", e, exc_info=True)
             self.send_response(500)
             self.send_header("Content-Type", "application/json")
             self.end_headers()
-            self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode("utf-8"))
+            self.wfile.write(_dumps({"success": False, "error": str(e)}))
 
     def handle_post_notes(self):
         """API: Add or update a note/task"""
-        if not self._check_auth():
-            self.send_response(401)
-            self.end_headers()
-            return
-
+        logger = getattr(self.server, "logger", None)
         try:
-            content_length = int(self.headers.get("Content-Length", 0))
+            content_length = self._content_length()
             if content_length == 0:
                 raise Exception("Empty body")
+            if content_length > _MAX_BODY:
+                self.wfile.write(_RESP_API_TOO_LARGE)
+                return
 
-            post_data = self.rfile.read(content_length).decode("utf-8")
-            payload = json.loads(post_data)
+            payload = _loads(self._read_body(content_length))
 
-            if hasattr(self.server, "logger") and self.server.logger:
-                self.server.logger.info(f"POST /api/notes - payload: {str(payload)[:200]}")
+            if logger:
+                logger.info("POST /api/notes - payload: %.200s", payload)
 
             container = getattr(self.server, "container", None)
             if not container:
@@ -726,26 +813,24 @@ class NotificationHandler(BaseHTTPRequestHandler):
                 raise Exception(f"Unknown action: {action}")
 
             # Emit signal to refresh UI
-            if hasattr(self.server, "signal"):
+            signal = getattr(self.server, "signal", None)
+            if signal:
                 msg = json.dumps({
                     "has_command": True,
                     "command": "REFRESH_TASKS",
                     "content": f"Remote Note: {action}",
                 })
-                self.server.signal.emit(msg)
+                signal.emit(msg)
 
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps(result).encode("utf-8"))
+            self.wfile.write(_build_response(_dumps(result)))
 
         except Exception as e:
-            if hasattr(self.server, "logger") and self.server.logger:
-                self.server.logger.error(f"API Error (POST notes): {e}")
+            if logger:
+                logger.error("API Error (POST notes): %s", e)
             self.send_response(500)
             self.send_header("Content-Type", "application/json")
             self.end_headers()
-            self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode("utf-8"))
+            self.wfile.write(_dumps({"success": False, "error": str(e)}))
 
     def handle_ping(self):
         """Real connectivity check — tests auth, DB, signal bridge, reports each."""
@@ -790,11 +875,40 @@ class NotificationHandler(BaseHTTPRequestHandler):
         if errors:
             result["errors"] = errors
 
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(result, ensure_ascii=False).encode("utf-8"))
+        self.wfile.write(_build_response(_dumps(result)))
 
     def log_message(self, format, *args):
         # Silent logging - use server logger instead
         return
+
+
+class NotificationHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer carrying the state NotificationHandler reads
+
+    Each request gets its own daemon thread, so a burst of notifications is
+    not serialized behind one slow client. Shared handler state is either
+    locked (rate limit store) or thread-safe by design (Qt signals emitted
+    off the GUI thread are queued).
+
+    Setting ``secret_key`` also caches its UTF-8 bytes and the auth flag, so
+    handlers never re-resolve or re-encode the key per request.
+    """
+
+    signal = None
+    logger = None
+    container = None
+    heartbeat = None
+
+    auth_enabled = False
+    secret_key_bytes = None
+    _secret_key = None
+
+    @property
+    def secret_key(self):
+        return self._secret_key
+
+    @secret_key.setter
+    def secret_key(self, key):
+        self._secret_key = key or None
+        self.auth_enabled = bool(key)
+        self.secret_key_bytes = key.encode("utf-8") if key else None
@@ -2,15 +2,19 @@
 Notification Server - Background thread for receiving notifications
 """
 
-from http.server import ThreadingHTTPServer
-
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from .notification_handler import NotificationHandler
+from .notification_handler import NotificationHandler, NotificationHTTPServer
 
 
 class NotificationServer(QThread):
-    """Luồng chạy server lắng nghe thông báo"""
+    """Luồng chạy server lắng nghe thông báo
+
+    Runs in-process on purpose: the /api/* handlers use the DI container,
+    the SQLite pool and the heartbeat tracker shared with the UI, none of
+    which can cross a process boundary. Request handling is short and
+    I/O-bound, so GIL contention with the Qt thread stays low.
+    """
 
     msg_received = pyqtSignal(str)
     bind_failed = pyqtSignal(int, str)  # port, error message
@@ -26,20 +30,16 @@ class NotificationServer(QThread):
 
     def run(self):
         try:
-            self._server = ThreadingHTTPServer(
+            self._server = NotificationHTTPServer(
                 (self.host, self.port), NotificationHandler
             )
-            self._server.allow_reuse_address = True
-            self._server.timeout = 5  # Socket timeout for graceful shutdown
             self._server.signal = self.msg_received
             self._server.logger = self.logger
             self._server.container = self.container
             self._server.heartbeat = self.heartbeat
 
             # --- AUTH CONFIG ---
-            from ..core.config import Config
-
-            secret_key = Config.from_env().secret_key
+            secret_key = self._get_secret_key()
             self._server.secret_key = secret_key
 
             if self.logger:
@@ -63,6 +63,20 @@ class NotificationServer(QThread):
         finally:
             self._cleanup()
 
+    def _get_secret_key(self) -> str:
+        """Secret key from the container's Config, built once at startup"""
+        try:
+            if self.container:
+                config = self.container.get("config")
+                if config:
+                    return config.secret_key
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Could not read secret key from config: {e}")
+        # Fallback: read from env
+        from ..core.config import Config
+        return Config.from_env().secret_key
+
     def stop(self):
         """Stop the server gracefully"""
         if self._server:
@@ -11,23 +11,30 @@ Handles the initialization sequence for the application:
 """
 
 import logging
+import os
 import sys
+import threading
 from typing import TYPE_CHECKING, Optional
 
 from PyQt6.QtWidgets import QApplication, QMessageBox
 
-from ..core.config import Config
+from ..core.config import ASSETS, Config
 from ..core.container import Container
 from ..core.exceptions import ConfigurationError
-from ..database.connection import init_db
-from .crash_handler import CrashHandler
+from ..database.connection import init_db_async, wait_ready
 from ..utils.logging import LoggerFactory
+from .qt_app import ensure_qapp
 
 if TYPE_CHECKING:
+    from .crash_handler import CrashHandler
     from .healthcheck import HealthCheckSystem
     from .profiler import ApplicationProfiler
     from .watchdog import ApplicationWatchdog
 
+_SEP = "=" * 70
+_PROD_ENVS = frozenset({"production", "prod"})
+_PROFILED_ENVS = frozenset({"dev", "development", "staging"})
+
 
 class ApplicationBootstrap:
     """
@@ -42,7 +49,7 @@ class ApplicationBootstrap:
         self.container: Optional[Container] = None
         self.logger: Optional[logging.Logger] = None
         self.qt_app: Optional[QApplication] = None
-        self.crash_handler: Optional[CrashHandler] = None
+        self.crash_handler: Optional["CrashHandler"] = None
         self.profiler: Optional["ApplicationProfiler"] = None
         self.watchdog: Optional["ApplicationWatchdog"] = None
         self.health_check: Optional["HealthCheckSystem"] = None
@@ -57,7 +64,6 @@ class ApplicationBootstrap:
         """
         try:
             # Step 1: Load configuration
-            config_metric = None
             self._load_configuration()
 
             # Step 2: Initialize logging
@@ -66,43 +72,47 @@ class ApplicationBootstrap:
             # Step 3: Initialize profiler
             self._initialize_profiler()
 
-            config_metric = self.profiler.start_metric("configuration_load")
-
-            self.logger.info("=" * 70)
-            self.logger.info(
-                f"Starting {self.config.app_name} v{self.config.app_version}"
-            )
-            self.logger.info(f"Environment: {self.config.environment}")
-            self.logger.info("=" * 70)
-
-            if config_metric:
-                self.profiler.end_metric(config_metric)
+            with self.profiler.metric("configuration_load"):
+                self.logger.info(
+                    "%s\nStarting %s v%s\nEnvironment: %s\n%s",
+                    _SEP,
+                    self.config.app_name,
+                    self.config.app_version,
+                    self.config.environment,
+                    _SEP,
+                )
 
-            # Step 4: Initialize database
-            db_metric = self.profiler.start_metric("database_init")
-            self._initialize_database()
-            self.profiler.end_metric(db_metric)
+            # Step 4: Initialize database (schema + migrations run in background,
+            # overlapping container and Qt setup; queries wait until it is done)
+            with self.profiler.metric("database_init"):
+                self._initialize_database()
 
             # Step 5: Initialize dependency injection container
-            container_metric = self.profiler.start_metric("container_init")
-            self._initialize_container()
-            self.profiler.end_metric(container_metric)
+            with self.profiler.metric("container_init"):
+                self._initialize_container()
 
             # Step 6: Set up global exception handling
             self._setup_exception_handling()
 
-            # Step 7: Initialize watchdog
-            self._initialize_watchdog()
-
-            # Step 8: Initialize health check system
-            self._initialize_health_check()
+            # Step 7-8: Watchdog and health check system (skipped for
+            # short-lived test/CLI runs)
+            if self.config.enable_background_services:
+                self._initialize_watchdog()
+                self._initialize_health_check()
+                self.container.register_many(
+                    {"watchdog": self.watchdog, "health_check": self.health_check}
+                )
 
             # Step 9: Initialize Qt Application
-            qt_metric = self.profiler.start_metric("qt_init")
-            self._initialize_qt_application()
-            self.profiler.end_metric(qt_metric)
+            with self.profiler.metric("qt_init"):
+                self._initialize_qt_application()
 
-            # Step 11: Run initial health checks
+            # Step 10: Wait for database schema before first use (only the
+            # part of the background init not hidden by steps 5-9)
+            with self.profiler.metric("database_wait"):
+                self._wait_for_database()
+
+            # Step 11: Run initial health checks (background, results are only logged)
             self._run_initial_health_checks()
 
             self._initialized = True
@@ -140,10 +150,15 @@ class ApplicationBootstrap:
                 + "\n".join(f"  - {e}" for e in errors)
             )
 
-        # Ensure required directories exist
-        self.config.log_dir.mkdir(parents=True, exist_ok=True)
-        self.config.export_dir.mkdir(parents=True, exist_ok=True)
-        self.config.backup_dir.mkdir(parents=True, exist_ok=True)
+        # Ensure required directories exist (a set, in case env vars point
+        # several of them at the same folder). Path.mkdir tries the leaf
+        # first and only walks parents when that fails.
+        for directory in {
+            self.config.log_dir,
+            self.config.export_dir,
+            self.config.backup_dir,
+        }:
+            directory.mkdir(parents=True, exist_ok=True)
 
     def _initialize_logging(self):
         """Initialize logging system"""
@@ -155,32 +170,38 @@ class ApplicationBootstrap:
         )
 
         self.logger.info("Logging system initialized")
-        self.logger.debug(f"Log directory: {self.config.log_dir}")
-        self.logger.debug(f"Log level: {self.config.log_level}")
+        self.logger.debug("Log directory: %s", self.config.log_dir)
+        self.logger.debug("Log level: %s", self.config.log_level)
 
     def _initialize_database(self):
-        """Initialize database connection and schema"""
+        """Start database schema initialization in the background"""
         self.logger.info("Initializing database...")
+        init_db_async(after=self._finish_database_init)
 
-        try:
-            # Initialize database schema
-            init_db()
-
-            self.logger.info(f"Database initialized: {self.config.db_path}")
+    def _finish_database_init(self):
+        """Run migrations after schema creation (on the db-init thread)"""
+        self.logger.info("Database initialized: %s", self.config.db_path)
 
-            # Run migrations
-            from ..database.migrations import MigrationManager
+        # Run migrations
+        from ..database.migrations import MigrationManager
 
-            migration_manager = MigrationManager(self.config.db_path)
-            migration_manager.migrate(logger=self.logger)
+        migration_manager = MigrationManager(self.config.db_path)
+        migration_manager.migrate(logger=self.logger)
 
-            # Log database info
-            if self.config.db_path.exists():
-                size_mb = self.config.db_path.stat().st_size / (1024 * 1024)
-                self.logger.debug(f"Database size: {size_mb:.2f} MB")
+        # Log database info (one stat, and only when it would be emitted)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            try:
+                size_mb = os.stat(self.config.db_path).st_size / (1024 * 1024)
+                self.logger.debug("Database size: %.2f MB", size_mb)
+            except OSError:
+                pass
 
+    def _wait_for_database(self):
+        """Block until background database initialization has finished"""
+        try:
+            wait_ready()
         except Exception as e:
-            self.logger.error(f"Database initialization failed: {e}")
+            self.logger.error("Database initialization failed: %s", e)
             raise
 
     def _initialize_container(self):
@@ -192,15 +213,17 @@ class ApplicationBootstrap:
             self.logger.info("Dependency injection container initialized")
 
         except Exception as e:
-            self.logger.error(f"Container initialization failed: {e}")
+            self.logger.error("Container initialization failed: %s", e)
             raise
 
     def _setup_exception_handling(self):
         """Set up global exception handling"""
+        from .crash_handler import CrashHandler
+
         self.logger.info("Setting up global exception handling...")
 
         # Create crash handler with auto-restart option
-        auto_restart = self.config.environment in ["production", "prod"]
+        auto_restart = self.config.environment in _PROD_ENVS
         self.crash_handler = CrashHandler(
             logger=self.logger, config=self.config, auto_restart=auto_restart
         )
@@ -215,10 +238,10 @@ class ApplicationBootstrap:
         from .profiler import ApplicationProfiler
 
         # Enable profiler in dev/staging, optional in production
-        enabled = self.config.environment in ["dev", "development", "staging"]
+        enabled = self.config.environment in _PROFILED_ENVS
         self.profiler = ApplicationProfiler(self.logger, enabled=enabled)
 
-        self.logger.info(f"Profiler initialized (enabled: {enabled})")
+        self.logger.info("Profiler initialized (enabled: %s)", enabled)
 
     def _initialize_watchdog(self):
         """Initialize application watchdog"""
@@ -233,9 +256,6 @@ class ApplicationBootstrap:
         # Don't start watchdog
         # self.watchdog.start()
 
-        # Store in container
-        self.container._services["watchdog"] = self.watchdog
-
         self.logger.info("Watchdog initialized (disabled)")
 
     def _initialize_health_check(self):
@@ -244,16 +264,23 @@ class ApplicationBootstrap:
 
         self.health_check = HealthCheckSystem(logger=self.logger, config=self.config)
 
-        # Store in container
-        self.container._services["health_check"] = self.health_check
-
         self.logger.info("Health check system initialized")
 
     def _run_initial_health_checks(self):
-        """Run initial health checks"""
+        """Start the initial health check sweep without blocking startup
+
+        The checks are disk/SQLite I/O whose results are only logged, so they
+        overlap main window creation instead of delaying it.
+        """
         if not self.health_check:
             return
 
+        threading.Thread(
+            target=self._log_initial_health_checks, name="health-check", daemon=True
+        ).start()
+
+    def _log_initial_health_checks(self):
+        """Run initial health checks and log critical issues (worker thread)"""
         self.logger.info("Running initial health checks...")
 
         try:
@@ -263,44 +290,47 @@ class ApplicationBootstrap:
             critical_checks = [c for c in checks if c.status.value == "critical"]
             if critical_checks:
                 self.logger.warning(
-                    f"Found {len(critical_checks)} critical health issues"
+                    "Found %d critical health issues", len(critical_checks)
                 )
                 for check in critical_checks:
-                    self.logger.warning(f"  - {check.name}: {check.message}")
+                    self.logger.warning("  - %s: %s", check.name, check.message)
 
         except Exception as e:
-            self.logger.error(f"Initial health check failed: {e}")
+            self.logger.error("Initial health check failed: %s", e)
 
     def _initialize_qt_application(self):
         """Initialize Qt Application"""
         self.logger.info("Initializing Qt application...")
 
-        # Create QApplication if not already created
-        if not QApplication.instance():
-            self.qt_app = QApplication(sys.argv)
-        else:
-            self.qt_app = QApplication.instance()
+        # Create QApplication if not already created (shared with the
+        # error/crash dialogs, so only one instance ever exists)
+        self.qt_app = ensure_qapp()
 
         # Set application metadata
         self.qt_app.setApplicationName(self.config.app_name)
         self.qt_app.setApplicationVersion(self.config.app_version)
         self.qt_app.setOrganizationName("Bangla Team")
 
-        # Set application icon if available
-        from ..core.config import ASSETS
+        # Set application icon once the event loop runs, so the PNG decode
+        # does not delay the first paint
+        from PyQt6.QtCore import QTimer
+
+        QTimer.singleShot(0, self._load_app_icon)
+
+        self.logger.info("Qt application initialized")
+
+    def _load_app_icon(self):
+        """Set the application icon if available"""
         icon_path = ASSETS / "icons" / "icon.png"
 
         if icon_path.exists():
             from PyQt6.QtGui import QIcon
             self.qt_app.setWindowIcon(QIcon(str(icon_path)))
 
-        self.logger.info("Qt application initialized")
-
     def _show_error_dialog(self, title: str, message: str):
         """Show error dialog to user"""
-        # Try to create a minimal QApplication for the error dialog
-        if not QApplication.instance():
-            QApplication(sys.argv)
+        # Reuse (or create once) a QApplication for the error dialog
+        ensure_qapp()
 
         msg_box = QMessageBox()
         msg_box.setIcon(QMessageBox.Icon.Critical)
@@ -335,14 +365,14 @@ class ApplicationBootstrap:
             raise RuntimeError("Profiler not initialized. Call initialize() first.")
         return self.profiler
 
-    def get_watchdog(self) -> "ApplicationWatchdog":
-        """Get the watchdog instance"""
-        if not self.watchdog:
-            raise RuntimeError("Watchdog not initialized. Call initialize() first.")
+    def get_watchdog(self) -> Optional["ApplicationWatchdog"]:
+        """Get the watchdog instance (None when background services are off)"""
+        if not self._initialized:
+            raise RuntimeError("Application not initialized. Call initialize() first.")
         return self.watchdog
 
-    def get_health_check(self) -> "HealthCheckSystem":
-        """Get the health check system"""
-        if not self.health_check:
-            raise RuntimeError("Health check not initialized. Call initialize() first.")
+    def get_health_check(self) -> Optional["HealthCheckSystem"]:
+        """Get the health check system (None when background services are off)"""
+        if not self._initialized:
+            raise RuntimeError("Application not initialized. Call initialize() first.")
         return self.health_check
@@ -9,18 +9,29 @@ Handles uncaught exceptions and provides comprehensive crash reporting:
 - User-friendly error dialogs
 """
 
+import heapq
 import logging
 import os
+import platform
+import shutil
 import sys
 import traceback
-import zipfile
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtWidgets import QMessageBox
 
 from ..core.config import Config
+from .qt_app import ensure_qapp
+
+_SEP = "=" * 70
+
+# Crash archive compression: fast deflate level, and logs at least this
+# large are stored uncompressed
+_ZIP_LEVEL = 1
+_ZIP_STORE_THRESHOLD = 10 * 1024 * 1024
+_ZIP_COPY_CHUNK = 1024 * 1024
 
 
 class CrashHandler:
@@ -41,9 +52,35 @@ class CrashHandler:
         self.logger = logger
         self.config = config
         self.auto_restart = auto_restart
-        self.crash_dir = config.log_dir / "crashes"
-        self.crash_dir.mkdir(parents=True, exist_ok=True)
+        self.crash_dir = config.log_dir / "crashes"  # Created on first crash
         self.crash_count = 0
+        # Static report sections: the app block is cheap and built here, the
+        # system block is built on the first crash (platform.processor() may
+        # spawn a subprocess, which startup should not pay for)
+        self._appinfo_block = (
+            f"  Name: {config.app_name}\n"
+            f"  Version: {config.app_version}\n"
+            f"  Environment: {config.environment}\n"
+            f"  Python: {sys.version}\n"
+            f"  Platform: {sys.platform}\n"
+            f"  Executable: {sys.executable}\n"
+        )
+        self._sysinfo_block: Optional[str] = None
+
+    def _get_sysinfo_block(self) -> str:
+        """System information section, computed once and reused"""
+        if self._sysinfo_block is None:
+            try:
+                self._sysinfo_block = (
+                    f"  OS: {platform.system()} {platform.release()}\n"
+                    f"  Version: {platform.version()}\n"
+                    f"  Machine: {platform.machine()}\n"
+                    f"  Processor: {platform.processor()}\n"
+                    f"  Architecture: {platform.architecture()}\n"
+                )
+            except:
+                self._sysinfo_block = "  (Unable to retrieve system info)\n"
+        return self._sysinfo_block
 
     def handle_exception(self, exc_type, exc_value, exc_traceback):
         """
@@ -63,16 +100,26 @@ class CrashHandler:
 
         self.crash_count += 1
 
+        # Format the traceback once for both the log and the report
+        formatted = "".join(
+            traceback.TracebackException(
+                exc_type, exc_value, exc_traceback, capture_locals=False
+            ).format()
+        )
+
         # Log the exception
-        self.logger.critical("=" * 70)
-        self.logger.critical(f"UNCAUGHT EXCEPTION #{self.crash_count}")
-        self.logger.critical("=" * 70)
         self.logger.critical(
-            "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+            "%s\nUNCAUGHT EXCEPTION #%d\n%s\n%s",
+            _SEP,
+            self.crash_count,
+            _SEP,
+            formatted,
         )
 
         # Save crash report
-        crash_file = self._save_crash_report(exc_type, exc_value, exc_traceback)
+        crash_file = self._save_crash_report(
+            exc_type, exc_value, exc_traceback, formatted
+        )
 
         # Create zip archive
         zip_file = self._create_crash_archive(crash_file)
@@ -89,105 +136,101 @@ class CrashHandler:
             # Exit application
             sys.exit(1)
 
-    def _save_crash_report(self, exc_type, exc_value, exc_traceback) -> Path:
+    def _save_crash_report(
+        self, exc_type, exc_value, exc_traceback, formatted: Optional[str] = None
+    ) -> Path:
         """
         Save comprehensive crash report to file.
 
+        Args:
+            formatted: Already formatted traceback text, if available
+
         Returns:
             Path: Path to crash report file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()  # One clock read for file name and header
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         crash_file = self.crash_dir / f"crash_{timestamp}.txt"
 
         try:
-            with open(crash_file, "w", encoding="utf-8") as f:
-                f.write("=" * 70 + "\n")
-                f.write(f"CRASH REPORT #{self.crash_count}\n")
-                f.write(f"Timestamp: {datetime.now().isoformat()}\n")
-                f.write("=" * 70 + "\n\n")
-
+            # Assemble the whole report first, then write it in one call
+            parts = [
+                _SEP + "\n",
+                f"CRASH REPORT #{self.crash_count}\n",
+                f"Timestamp: {now.isoformat()}\n",
+                _SEP + "\n\n",
                 # Application info
-                f.write("Application Information:\n")
-                f.write(f"  Name: {self.config.app_name}\n")
-                f.write(f"  Version: {self.config.app_version}\n")
-                f.write(f"  Environment: {self.config.environment}\n")
-                f.write(f"  Python: {sys.version}\n")
-                f.write(f"  Platform: {sys.platform}\n")
-                f.write(f"  Executable: {sys.executable}\n")
-                f.write("\n")
-
+                "Application Information:\n",
+                self._appinfo_block,
+                "\n",
                 # Exception info
-                f.write("Exception Information:\n")
-                f.write(f"  Type: {exc_type.__name__}\n")
-                f.write(f"  Module: {exc_type.__module__}\n")
-                f.write(f"  Message: {str(exc_value)}\n")
-                f.write("\n")
-
+                "Exception Information:\n",
+                f"  Type: {exc_type.__name__}\n",
+                f"  Module: {exc_type.__module__}\n",
+                f"  Message: {str(exc_value)}\n",
+                "\n",
                 # Full traceback
-                f.write("Traceback:\n")
-                f.write(
-                    "".join(
-                        traceback.format_exception(exc_type, exc_value, exc_traceback)
-                    )
-                )
-                f.write("\n")
-
+                "Traceback:\n",
+                formatted
+                or "".join(
+                    traceback.format_exception(exc_type, exc_value, exc_traceback)
+                ),
+                "\n",
                 # System info
-                f.write("System Information:\n")
-                try:
-                    import platform
-
-                    f.write(f"  OS: {platform.system()} {platform.release()}\n")
-                    f.write(f"  Version: {platform.version()}\n")
-                    f.write(f"  Machine: {platform.machine()}\n")
-                    f.write(f"  Processor: {platform.processor()}\n")
-                    f.write(f"  Architecture: {platform.architecture()}\n")
-                except:
-                    f.write("  (Unable to retrieve system info)\n")
-                f.write("\n")
-
-                # Resource info
-                f.write("Resource Information:\n")
-                try:
-                    import psutil
-
-                    mem = psutil.virtual_memory()
-                    disk = psutil.disk_usage("/")
-                    f.write(
-                        f"  Memory: {mem.percent:.1f}% used ({mem.used / 1024 / 1024 / 1024:.2f} GB / {mem.total / 1024 / 1024 / 1024:.2f} GB)\n"
-                    )
-                    f.write(
-                        f"  Disk: {disk.percent:.1f}% used ({disk.free / 1024 / 1024 / 1024:.2f} GB free)\n"
-                    )
-                    f.write(f"  CPU: {psutil.cpu_percent()}%\n")
-                except:
-                    f.write("  (psutil not available)\n")
-                f.write("\n")
-
-                # Environment variables (filtered)
-                f.write("Environment Variables:\n")
-                safe_vars = [
-                    "PATH",
-                    "PYTHONPATH",
-                    "TEMP",
-                    "TMP",
-                    "USERNAME",
-                    "COMPUTERNAME",
-                ]
-                for var in safe_vars:
-                    value = os.environ.get(var, "N/A")
-                    f.write(f"  {var}: {value}\n")
-                f.write("\n")
-
-                # Loaded modules
-                f.write("Loaded Modules:\n")
-                for name, module in sorted(sys.modules.items())[:50]:  # First 50
-                    if hasattr(module, "__version__"):
-                        f.write(f"  {name}: {module.__version__}\n")
-                    elif hasattr(module, "__file__"):
-                        f.write(f"  {name}: {module.__file__}\n")
-                    else:
-                        f.write(f"  {name}\n")
+                "System Information:\n",
+                self._get_sysinfo_block(),
+                "\n",
+            ]
+
+            # Resource info
+            parts.append("Resource Information:\n")
+            try:
+                import psutil
+
+                mem = psutil.virtual_memory()
+                disk = psutil.disk_usage("/")
+                parts.append(
+                    f"  Memory: {mem.percent:.1f}% used ({mem.used / 1024 / 1024 / 1024:.2f} GB / {mem.total / 1024 / 1024 / 1024:.2f} GB)\n"
+                )
+                parts.append(
+                    f"  Disk: {disk.percent:.1f}% used ({disk.free / 1024 / 1024 / 1024:.2f} GB free)\n"
+                )
+                parts.append(f"  CPU: {psutil.cpu_percent()}%\n")
+            except:
+                parts.append("  (psutil not available)\n")
+            parts.append("\n")
+
+            # Environment variables (filtered)
+            parts.append("Environment Variables:\n")
+            safe_vars = [
+                "PATH",
+                "PYTHONPATH",
+                "TEMP",
+                "TMP",
+                "USERNAME",
+                "COMPUTERNAME",
+            ]
+            for var in safe_vars:
+                value = os.environ.get(var, "N/A")
+                parts.append(f"  {var}: {value}\n")
+            parts.append("\n")
+
+            # Loaded modules
+            parts.append("Loaded Modules:\n")
+            # First 50 by name: partial sort over a snapshot of the names
+            modules = sys.modules
+            for name in heapq.nsmallest(50, list(modules)):
+                module = modules.get(name)
+                if hasattr(module, "__version__"):
+                    parts.append(f"  {name}: {module.__version__}\n")
+                elif hasattr(module, "__file__"):
+                    parts.append(f"  {name}: {module.__file__}\n")
+                else:
+                    parts.append(f"  {name}\n")
+
+            self.crash_dir.mkdir(parents=True, exist_ok=True)
+            with open(crash_file, "w", encoding="utf-8") as f:
+                f.write("".join(parts))
 
             self.logger.info(f"Crash report saved: {crash_file}")
 
@@ -206,21 +249,40 @@ class CrashHandler:
         Returns:
             Path to zip file or None if failed
         """
+        # Only needed once something has crashed; keep it off the import path
+        import zipfile
+
         try:
             zip_path = crash_file.with_suffix(".zip")
 
-            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            # Fast deflate: archiving runs while the user waits on a crash
+            with zipfile.ZipFile(
+                zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=_ZIP_LEVEL
+            ) as zipf:
                 # Add crash report
                 zipf.write(crash_file, crash_file.name)
 
-                # Add recent log files (last 3)
+                # Add recent log files (last 3), one stat per file
                 log_files = sorted(
-                    self.config.log_dir.glob("*.log"),
-                    key=lambda p: p.stat().st_mtime,
+                    ((log_file.stat(), log_file)
+                     for log_file in self.config.log_dir.glob("*.log")),
+                    key=lambda entry: entry[0].st_mtime,
                     reverse=True,
                 )[:3]
-                for log_file in log_files:
-                    zipf.write(log_file, f"logs/{log_file.name}")
+                for st, log_file in log_files:
+                    arcname = f"logs/{log_file.name}"
+                    if st.st_size < _ZIP_STORE_THRESHOLD:
+                        zipf.write(log_file, arcname)
+                        continue
+
+                    # Large logs are stored as-is (deflating them dominates)
+                    # and copied in big chunks instead of ZipFile.write's 8 KiB
+                    zinfo = zipfile.ZipInfo.from_file(log_file, arcname)
+                    zinfo.compress_type = zipfile.ZIP_STORED
+                    with open(log_file, "rb") as src, zipf.open(
+                        zinfo, "w", force_zip64=True
+                    ) as dst:
+                        shutil.copyfileobj(src, dst, _ZIP_COPY_CHUNK)
 
                 # Add config (without sensitive data)
                 try:
@@ -253,8 +315,7 @@ Log Level: {self.config.log_level}
         """
         try:
             # Ensure QApplication exists
-            if not QApplication.instance():
-                QApplication(sys.argv)
+            ensure_qapp()
 
             # Create error message
             error_msg = (
@@ -317,19 +378,3 @@ Log Level: {self.config.log_level}
         except Exception as e:
             self.logger.error(f"Failed to restart application: {e}")
             sys.exit(1)
-
-
-class QtExceptionHandler:
-    """
-    Handler for Qt-specific exceptions.
-
-    Qt has its own exception handling that sometimes swallows exceptions.
-    This class helps catch those.
-    """
-
-    def __init__(self, crash_handler: CrashHandler):
-        self.crash_handler = crash_handler
-
-    def handle_qt_exception(self, exc_type, exc_value, exc_traceback):
-        """Handle Qt exception"""
-        self.crash_handler.handle_exception(exc_type, exc_value, exc_traceback)
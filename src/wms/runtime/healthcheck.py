@@ -10,14 +10,35 @@ Provides comprehensive health checks for:
 """
 
 import logging
+import os
 import sqlite3
 import sys
+import tempfile
+import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from .watchdog import HealthCheck, HealthStatus
 
 
+def _scan_files(directory, prefix: str = "", suffix: str = "") -> List[os.stat_result]:
+    """Stat the files in a directory matching prefix/suffix, in one pass
+
+    A missing directory has no files.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [
+                entry.stat()
+                for entry in it
+                if entry.name.startswith(prefix)
+                and entry.name.endswith(suffix)
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
 class HealthCheckSystem:
     """
     Comprehensive health check system.
@@ -25,9 +46,29 @@ class HealthCheckSystem:
     Performs various health checks to ensure application is functioning properly.
     """
 
+    # Seconds a check result is reused by run_all_checks()
+    CHECK_TTL = {
+        "database": 30,
+        "filesystem": 10,
+        "log_files": 10,
+        "crash_reports": 60,
+        "configuration": 300,  # Config is loaded once per process
+    }
+
     def __init__(self, logger: logging.Logger, config):
         self.logger = logger
         self.config = config
+        self._cache: Dict[str, Tuple[float, HealthCheck]] = {}
+
+    def _cached(self, name: str, check) -> HealthCheck:
+        """Run a check, or reuse its last result while within CHECK_TTL"""
+        now = time.monotonic()
+        hit = self._cache.get(name)
+        if hit is not None and now - hit[0] < self.CHECK_TTL.get(name, 0):
+            return hit[1]
+        result = check()
+        self._cache[name] = (now, result)
+        return result
 
     def check_database(self) -> HealthCheck:
         """Check database connectivity and integrity"""
@@ -96,11 +137,11 @@ class HealthCheckSystem:
                 elif not dir_path.is_dir():
                     issues.append(f"{dir_path.name} is not a directory")
                 else:
-                    # Test write access
-                    test_file = dir_path / f".write_test_{datetime.now().timestamp()}"
+                    # Test write access (anonymous temp file, O_TMPFILE on
+                    # Linux: nothing to unlink or leave behind)
                     try:
-                        test_file.write_text("test")
-                        test_file.unlink()
+                        with tempfile.TemporaryFile(dir=dir_path) as test_file:
+                            test_file.write(b"test")
                     except Exception as e:
                         issues.append(f"{dir_path.name} not writable: {e}")
 
@@ -150,8 +191,8 @@ class HealthCheckSystem:
     def check_log_files(self) -> HealthCheck:
         """Check log file sizes"""
         try:
-            log_files = list(self.config.log_dir.glob("*.log"))
-            total_size = sum(f.stat().st_size for f in log_files) / 1024 / 1024  # MB
+            log_files = _scan_files(self.config.log_dir, suffix=".log")
+            total_size = sum(st.st_size for st in log_files) / 1024 / 1024  # MB
 
             # Warning at 100MB, critical at 500MB
             if total_size > 500:
@@ -190,16 +231,9 @@ class HealthCheckSystem:
     def check_crash_reports(self) -> HealthCheck:
         """Check for recent crash reports"""
         try:
-            crash_dir = self.config.log_dir / "crashes"
-            if not crash_dir.exists():
-                return HealthCheck(
-                    name="crash_reports",
-                    status=HealthStatus.HEALTHY,
-                    message="No crash reports",
-                    timestamp=datetime.now(),
-                )
-
-            crash_files = list(crash_dir.glob("crash_*.txt"))
+            crash_files = _scan_files(
+                self.config.log_dir / "crashes", prefix="crash_", suffix=".txt"
+            )
 
             if not crash_files:
                 return HealthCheck(
@@ -212,10 +246,9 @@ class HealthCheckSystem:
             # Check for recent crashes (last 24 hours)
             recent_crashes = []
             now = datetime.now().timestamp()
-            for crash_file in crash_files:
-                file_time = crash_file.stat().st_mtime
-                if now - file_time < 86400:  # 24 hours
-                    recent_crashes.append(crash_file)
+            for st in crash_files:
+                if now - st.st_mtime < 86400:  # 24 hours
+                    recent_crashes.append(st)
 
             if recent_crashes:
                 return HealthCheck(
@@ -274,22 +307,29 @@ class HealthCheckSystem:
                 timestamp=datetime.now(),
             )
 
-    def run_all_checks(self) -> List[HealthCheck]:
+    def run_all_checks(self, use_cache: bool = True) -> List[HealthCheck]:
         """
         Run all health checks.
 
+        Args:
+            use_cache: Reuse results younger than CHECK_TTL (False forces a
+                fresh run of every check)
+
         Returns:
             List of HealthCheck results
         """
-        checks = []
+        if not use_cache:
+            self._cache.clear()
 
         self.logger.info("Running health checks...")
 
-        checks.append(self.check_database())
-        checks.append(self.check_filesystem())
-        checks.append(self.check_log_files())
-        checks.append(self.check_crash_reports())
-        checks.append(self.check_configuration())
+        checks = [
+            self._cached("database", self.check_database),
+            self._cached("filesystem", self.check_filesystem),
+            self._cached("log_files", self.check_log_files),
+            self._cached("crash_reports", self.check_crash_reports),
+            self._cached("configuration", self.check_configuration),
+        ]
 
         # Log summary
         critical = sum(1 for c in checks if c.status == HealthStatus.CRITICAL)
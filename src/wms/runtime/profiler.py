@@ -9,6 +9,7 @@ Monitors and profiles application performance:
 - Performance bottleneck detection
 """
 
+import contextlib
 import functools
 import logging
 import threading
@@ -26,6 +27,9 @@ try:
 except ImportError:
     HAS_PSUTIL = False
 
+# Shared no-op context returned by ApplicationProfiler.metric() when disabled
+_NULL_METRIC = contextlib.nullcontext()
+
 
 @dataclass
 class PerformanceMetric:
@@ -138,6 +142,28 @@ class ApplicationProfiler:
 
         self.logger.info(msg)
 
+    def metric(self, name: str, **metadata):
+        """
+        Context manager that tracks a performance metric around a block.
+
+        Yields the PerformanceMetric, or None when profiling is disabled.
+
+        Example:
+            with profiler.metric("database_init"):
+                initialize_database()
+        """
+        if not self.enabled:
+            return _NULL_METRIC
+        return self._metric(name, **metadata)
+
+    @contextlib.contextmanager
+    def _metric(self, name: str, **metadata):
+        metric = self.start_metric(name, **metadata)
+        try:
+            yield metric
+        finally:
+            self.end_metric(metric)
+
     def profile_function(self, name: Optional[str] = None):
         """
         Decorator to profile a function.
@@ -0,0 +1,27 @@
+"""
+Shared QApplication access
+
+Bootstrap, error dialogs and crash dialogs all need a QApplication; they
+get it here so only one instance is ever created.
+"""
+
+import sys
+from typing import Optional
+
+from PyQt6.QtWidgets import QApplication
+
+# Created here only when no QApplication exists yet. Kept referenced: an
+# unreferenced QApplication is destroyed right away, and building a second
+# one repeats Qt's plugin discovery.
+_qapp: Optional[QApplication] = None
+
+
+def ensure_qapp() -> QApplication:
+    """Return the running QApplication, creating one instance once"""
+    global _qapp
+    app = QApplication.instance()
+    if app is None:
+        if _qapp is None:
+            _qapp = QApplication(sys.argv)
+        app = _qapp
+    return app
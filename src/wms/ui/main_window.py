@@ -12,15 +12,15 @@ from pathlib import Path
 from PyQt6.QtCore import (QEasingCurve, QEvent, QPropertyAnimation, Qt, QThread,
                                   QTimer, pyqtSignal)
 from PyQt6.QtGui import QFont, QIcon
-from PyQt6.QtWidgets import (QApplication, QFrame, QGraphicsOpacityEffect,
-                             QHBoxLayout, QLabel, QMainWindow, QPushButton,
+from PyQt6.QtWidgets import (QApplication, QButtonGroup, QFrame,
+                             QGraphicsOpacityEffect, QHBoxLayout, QLabel, QMainWindow, QPushButton,
                                       QMessageBox, QStackedWidget, QTabWidget,
                                       QVBoxLayout, QWidget)
 
 from ..core.constants import (APP_NAME, APP_VERSION, WINDOW_HEIGHT,
                               WINDOW_MIN_HEIGHT, WINDOW_MIN_WIDTH, WINDOW_WIDTH)
 from .theme import AppColors, AppTheme
-from ..core.paths import ASSETS, DATA
+from ..core.paths import DATA
 from ..core.updater import GitHubReleaseUpdater, UpdateInfo
 
 # Import network components
@@ -29,15 +29,10 @@ from ..network.discovery_server import DiscoveryServer
 from ..network.network_monitor import NetworkMonitor, get_best_ip
 from ..network.connection_heartbeat import ConnectionHeartbeat
 from ..database.task_repository import TaskRepository
-# Import views
+# Import views needed for the first paint; other pages are imported by
+# their factories in _create_views()
 from .views.calculation_view import CalculationView
-from .views.calculator_tool_view import CalculatorToolView
-from .views.history_view import HistoryView
-from .views.product_view import ProductView
-from .views.settings_view import SettingsView
-from .views.stock_view import StockView
 from .views.task_view import TaskView
-from .views.bank_view import BankView
 from .widgets.quick_bank_peek import QuickBankPeek
 from .widgets.status_indicator import StatusIndicator
 from .widgets.update_dialog import UpdateDialog
@@ -46,6 +41,19 @@ from ..workers.notification_processor import NotificationProcessor
 # BankView, NotificationHandler, NotificationServer, QuickBankPeek
 # have been moved to separate files for better organization
 
+# Sidebar pages, in content_stack order
+_NAV_PAGES = ("Quản lý", "Ghi chú", "Ngân hàng", "Lịch sử", "Cài đặt", "Máy tính")
+_BREADCRUMBS = tuple(f"Trang chủ / {name}" for name in _NAV_PAGES)
+
+_HTML_SPECIAL = frozenset("<>&\"'")
+
+
+def _escape_html(text: str) -> str:
+    """html.escape, skipped for the common case of plain text"""
+    if _HTML_SPECIAL.isdisjoint(text):
+        return text
+    return html.escape(text)
+
 
 class UpdateCheckWorker(QThread):
     update_available = pyqtSignal(object)
@@ -336,11 +344,8 @@ class MainWindow(QMainWindow):
         self.resize(WINDOW_WIDTH, WINDOW_HEIGHT)
         self.setMinimumSize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
 
-        icon_path = ASSETS / "icon.png"
-        if icon_path.exists():
-            icon = QIcon(str(icon_path))
-            if not icon.isNull():
-                self.setWindowIcon(icon)
+        # No per-window icon: top-level windows and dialogs fall back to the
+        # QApplication window icon set during startup, so the PNG is read once.
 
         screen = QApplication.primaryScreen().geometry()
         x = (screen.width() - WINDOW_WIDTH) // 2
@@ -409,12 +414,13 @@ class MainWindow(QMainWindow):
         sidebar_layout.addSpacing(16)
 
         self.nav_btns = []
-        self._add_nav_btn(sidebar_layout, "Quản lý", 0)
-        self._add_nav_btn(sidebar_layout, "Ghi chú", 1)
-        self._add_nav_btn(sidebar_layout, "Ngân hàng", 2)
-        self._add_nav_btn(sidebar_layout, "Lịch sử", 3)
-        self._add_nav_btn(sidebar_layout, "Cài đặt", 4)
-        self._add_nav_btn(sidebar_layout, "Máy tính", 5)
+        self._active_nav_index = None
+        # One idClicked connection dispatches every nav button by its index
+        self._nav_group = QButtonGroup(self)
+        self._nav_group.setExclusive(False)
+        self._nav_group.idClicked.connect(self._switch_view)
+        for index, text in enumerate(_NAV_PAGES):
+            self._add_nav_btn(sidebar_layout, text, index)
 
         sidebar_layout.addStretch()
 
@@ -493,17 +499,18 @@ class MainWindow(QMainWindow):
         self.product_list_tab = self.calc_view.prod_tab
         self.management_tabs.addTab(self.product_list_tab, "Danh sách SP")
 
-        self.management_tabs.addTab(self.stock_view, "Kho hàng")
-        self.management_tabs.addTab(self.product_view, "Sản phẩm")
+        # Stock / product tabs are built when first selected
+        for _, label in self._lazy_tabs.values():
+            self.management_tabs.addTab(QWidget(), label)
+        self.management_tabs.currentChanged.connect(self._ensure_tab)
 
         management_layout.addWidget(self.management_tabs)
 
         self.content_stack.addWidget(self.management_view)
         self.content_stack.addWidget(self.task_view)
-        self.content_stack.addWidget(self.bank_view)
-        self.content_stack.addWidget(self.history_view)
-        self.content_stack.addWidget(self.settings_view)
-        self.content_stack.addWidget(self.calculator_view)
+        # Bank, history, settings, calculator: placeholders until first shown
+        for _ in self._lazy_views:
+            self.content_stack.addWidget(QWidget())
 
         main_content = QWidget()
         content_layout = QVBoxLayout(main_content)
@@ -570,7 +577,7 @@ class MainWindow(QMainWindow):
         btn = QPushButton(text)
         btn.setObjectName("navItem")
         btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn.clicked.connect(lambda: self._switch_view(index))
+        self._nav_group.addButton(btn, index)
 
         # Nhấn giữ nút bên trái vẫn dùng hold
         if index == 2:  # Bank view is now at index 2
@@ -608,7 +615,7 @@ class MainWindow(QMainWindow):
             self.quick_peek = QuickBankPeek(self)
             self.quick_peek.installEventFilter(self)
 
-        self.quick_peek.update_data(self.bank_view.table)
+        self.quick_peek.update_data(self._ensure_bank_view())
         pos = self.notif_banner.mapToGlobal(self.notif_banner.rect().bottomLeft())
         self.quick_peek.move(pos.x(), pos.y() + 5)
         self.quick_peek.show()
@@ -630,7 +637,7 @@ class MainWindow(QMainWindow):
             self.quick_peek = QuickBankPeek(self)
             self.quick_peek.installEventFilter(self)
 
-        self.quick_peek.update_data(self.bank_view.table)
+        self.quick_peek.update_data(self._ensure_bank_view())
         btn_pos = self.bank_btn.mapToGlobal(self.bank_btn.rect().topRight())
         self.quick_peek.move(btn_pos.x() + 10, btn_pos.y())
         self.quick_peek.show()
@@ -641,16 +648,14 @@ class MainWindow(QMainWindow):
         if self.content_stack.currentIndex() == index:
             return
 
+        self._ensure_view(index)
+
         # Switch page and update UI immediately
         self.content_stack.setCurrentIndex(index)
-        names = ["Quản lý", "Ghi chú", "Ngân hàng", "Lịch sử", "Cài đặt", "Máy tính"]
-        self.breadcrumb.setText(f"Trang chủ / {names[index]}")
+        self.breadcrumb.setText(_BREADCRUMBS[index])
 
         # Update nav buttons
-        for i, btn in enumerate(self.nav_btns):
-            btn.setProperty("active", i == index)
-            btn.style().unpolish(btn)
-            btn.style().polish(btn)
+        self._set_active_nav(index)
 
         # Subtle fade-in on the new page only (per-page effect, no ghosting)
         try:
@@ -670,13 +675,24 @@ class MainWindow(QMainWindow):
 
     def _switch_view_direct(self, index):
         """Switch view directly without animation (fallback)"""
+        self._ensure_view(index)
         self.content_stack.setCurrentIndex(index)
-        names = ["Quản lý", "Ghi chú", "Ngân hàng", "Lịch sử", "Cài đặt", "Máy tính"]
-        self.breadcrumb.setText(f"Trang chủ / {names[index]}")
-        for i, btn in enumerate(self.nav_btns):
+        self.breadcrumb.setText(_BREADCRUMBS[index])
+        self._set_active_nav(index)
+
+    def _set_active_nav(self, index):
+        """Restyle only the nav buttons whose active state changed"""
+        previous = self._active_nav_index
+        if previous == index:
+            return
+        for i in (previous, index):
+            if i is None or i >= len(self.nav_btns):
+                continue
+            btn = self.nav_btns[i]
             btn.setProperty("active", i == index)
             btn.style().unpolish(btn)
             btn.style().polish(btn)
+        self._active_nav_index = index
 
     def _create_views(self):
         # Initialize error handler
@@ -684,25 +700,127 @@ class MainWindow(QMainWindow):
 
         self.error_handler = ErrorHandler(self.logger)
 
-        # Pass container to views
+        # Pass container to views. Only the first page is built up front, plus
+        # TaskView because it owns the pending-task reminder timer.
         self.calc_view = CalculationView(
             container=self.container,
             on_refresh_stock=self._refresh_stock,
             get_online_count=self._get_android_online_count,
         )
-        self.stock_view = StockView(on_refresh_calc=self._refresh_calc)
-        self.product_view = ProductView(
-            container=self.container, on_refresh_calc=self._refresh_calc
-        )
         self.task_view = TaskView(container=self.container)
+
+        # Pages built on first activation; a placeholder QWidget holds their
+        # slot until then. content_stack index -> factory
+        self._row_height = None
+        self._widget_height = None
+        self._lazy_views = {
+            2: self._create_bank_view,
+            3: self._create_history_view,
+            4: self._create_settings_view,
+            5: self._create_calculator_view,
+        }
+        # management_tabs index -> (factory, label)
+        self._lazy_tabs = {
+            2: (self._create_stock_view, "Kho hàng"),
+            3: (self._create_product_view, "Sản phẩm"),
+        }
+
+    def _create_bank_view(self):
+        from .views.bank_view import BankView
+
         self.bank_view = BankView()
+        return self.bank_view
+
+    def _create_history_view(self):
+        from .views.history_view import HistoryView
+
         self.history_view = HistoryView()
+        return self.history_view
+
+    def _create_settings_view(self):
+        from .views.settings_view import SettingsView
+
         self.settings_view = SettingsView(container=self.container)
-        self.calculator_view = CalculatorToolView()
 
         # Connect signals for settings real-time updates
         self.settings_view.row_height_changed.connect(self._on_row_height_changed)
         self.settings_view.widget_height_changed.connect(self._on_widget_height_changed)
+        return self.settings_view
+
+    def _create_calculator_view(self):
+        from .views.calculator_tool_view import CalculatorToolView
+
+        self.calculator_view = CalculatorToolView()
+        return self.calculator_view
+
+    def _create_stock_view(self):
+        from .views.stock_view import StockView
+
+        self.stock_view = StockView(on_refresh_calc=self._refresh_calc)
+        return self.stock_view
+
+    def _create_product_view(self):
+        from .views.product_view import ProductView
+
+        self.product_view = ProductView(
+            container=self.container, on_refresh_calc=self._refresh_calc
+        )
+        return self.product_view
+
+    def _apply_view_settings(self, view):
+        """Apply runtime settings changed before ``view`` existed"""
+        if self._row_height is not None and hasattr(view, "table"):
+            view.table.verticalHeader().setDefaultSectionSize(self._row_height)
+        if self._widget_height is not None and view in (
+            getattr(self, "stock_view", None),
+            getattr(self, "product_view", None),
+        ):
+            view._widget_height = self._widget_height
+            view.refresh_list()
+
+    def _ensure_tab(self, index):
+        """Build the management sub-tab at ``index`` if it is still a placeholder"""
+        entry = self._lazy_tabs.pop(index, None)
+        if entry is None:
+            return
+
+        factory, label = entry
+        view = factory()
+        placeholder = self.management_tabs.widget(index)
+        self.management_tabs.blockSignals(True)
+        try:
+            self.management_tabs.removeTab(index)
+            self.management_tabs.insertTab(index, view, label)
+            self.management_tabs.setCurrentIndex(index)
+        finally:
+            self.management_tabs.blockSignals(False)
+        placeholder.deleteLater()
+        self._apply_view_settings(view)
+
+    def _ensure_view(self, index):
+        """Build the page at ``index`` if it is still a placeholder"""
+        factory = self._lazy_views.pop(index, None)
+        if factory is None:
+            return
+
+        view = factory()
+        placeholder = self.content_stack.widget(index)
+        self.content_stack.insertWidget(index, view)
+        self.content_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+
+        self._apply_view_settings(view)
+
+        if hasattr(self, "_page_effects"):
+            effect = QGraphicsOpacityEffect(view)
+            effect.setOpacity(1.0)
+            view.setGraphicsEffect(effect)
+            self._page_effects[index] = effect
+
+    def _ensure_bank_view(self):
+        """Return BankView, creating it on demand"""
+        self._ensure_view(2)
+        return self.bank_view
 
     def _refresh_stock(self):
         """Refresh stock list in calculation view and stock view"""
@@ -969,8 +1087,7 @@ class MainWindow(QMainWindow):
             # Change notif_box color to INFO (Emerald Dark or Blue) for system/command events
             if cmd == "PING_SUCCESS":
                 # Show test-connection result in the bottom ticker bar
-                if hasattr(self, "bank_view"):
-                    self.bank_view.add_system_log(f"{data['content']}")
+                self._ensure_bank_view().add_system_log(f"{data['content']}")
                 self.task_banner.show_message(
                     f"📱 {data['content']}", duration=4000
                 )
@@ -1003,14 +1120,13 @@ class MainWindow(QMainWindow):
             self.status_indicator.record_notification()
 
         if has_amount:
-            safe_sender = html.escape(sender_name[:30]) if sender_name else ""
-            safe_source = html.escape(source)
-            safe_amount = html.escape(amount)
-
-            if safe_sender:
-                rich_text = f"<span style='font-size:13px; color:white;'>{timestamp} | <b>{safe_amount}</b> | {safe_sender}</span>"
-            else:
-                rich_text = f"<span style='font-size:13px; color:white;'>{timestamp} | <b>{safe_amount}</b> | {safe_source}</span>"
+            # Sender takes precedence over source, so only one is escaped
+            label = _escape_html(sender_name[:30] if sender_name else source)
+            safe_amount = _escape_html(amount)
+            rich_text = (
+                "<span style='font-size:13px; color:white;'>"
+                f"{timestamp} | <b>{safe_amount}</b> | {label}</span>"
+            )
 
             # Show banner (Bank notifications stay until closed or replaced)
             self.notif_banner.show_message(rich_text)
@@ -1025,8 +1141,8 @@ class MainWindow(QMainWindow):
         elif is_bank:
             # Bank notification received but amount could not be parsed —
             # show a dim amber notice so the user knows something arrived
-            safe_source = html.escape(source)
-            safe_content = html.escape((content or "")[:80])
+            safe_source = _escape_html(source)
+            safe_content = _escape_html((content or "")[:80])
             amber_text = (
                 f"<span style='font-size:12px; color:{AppColors.WARNING_AMBER};'>"
                 f"📬 {timestamp} | {safe_source} | {safe_content}"
@@ -1037,20 +1153,17 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
-        if hasattr(self, "bank_view"):
-            # Always add to raw logs
-            self.bank_view.add_raw_log(timestamp, source, content)
+        # BankView persists the notification, so build it if still deferred
+        bank_view = self._ensure_bank_view()
 
-            # Only add to transactions if it has amount
-            if has_amount:
-                self.bank_view.add_notif(
-                    timestamp, source, amount, sender_name, content
-                )
-        else:
-            if self.logger:
-                self.logger.warning(
-                    "bank_view not initialized yet, notification not saved"
-                )
+        # Always add to raw logs
+        bank_view.add_raw_log(timestamp, source, content)
+
+        # Only add to transactions if it has amount
+        if has_amount:
+            bank_view.add_notif(
+                timestamp, source, amount, sender_name, content
+            )
 
     def _handle_notification_error(self, error_msg: str):
         """Handle notification processing errors"""
@@ -1059,11 +1172,10 @@ class MainWindow(QMainWindow):
 
     def _handle_task_matched(self, note_id: int, note_code: str, amount: str):
         """Called when a bank payment is auto-matched to a task"""
-        import html as _html
         banner_msg = (
             f"<span style='font-size:13px; color:{AppColors.PRIMARY_LIGHT};'>"
-            f"✅ Thanh toán khớp: <b>{_html.escape(note_code)}</b> "
-            f"— {_html.escape(amount)}"
+            f"✅ Thanh toán khớp: <b>{_escape_html(note_code)}</b> "
+            f"— {_escape_html(amount)}"
             f"</span>"
         )
         try:
@@ -1179,6 +1291,9 @@ class MainWindow(QMainWindow):
 
     def _on_row_height_changed(self, height: int):
         """Cập nhật chiều cao row cho tất cả tables"""
+        # Remembered for views that are built later
+        self._row_height = height
+
         # Calculation view
         if hasattr(self, "calc_view"):
             self.calc_view.table.verticalHeader().setDefaultSectionSize(height)
@@ -1207,7 +1322,9 @@ class MainWindow(QMainWindow):
 
     def _on_widget_height_changed(self, height: int):
         """Cập nhật chiều cao widget - cần refresh lại views"""
-        # Lưu giá trị mới
+        # Lưu giá trị mới (cũng dùng cho views được tạo sau)
+        self._widget_height = height
+
         if hasattr(self, "calc_view"):
             self.calc_view._widget_height = height
             self.calc_view.refresh_table()
@@ -1222,7 +1339,12 @@ class MainWindow(QMainWindow):
             self.product_view.refresh_list()
 
     def _apply_theme(self):
-        self.setStyleSheet(AppTheme.get_stylesheet())
+        # Re-applying QSS re-polishes every child widget; skip if unchanged
+        qss = AppTheme.get_stylesheet()
+        if qss is getattr(self, "_last_qss", None):
+            return
+        self._last_qss = qss
+        self.setStyleSheet(qss)
 
     def _setup_keyboard_shortcuts(self):
         """Setup global keyboard shortcuts"""
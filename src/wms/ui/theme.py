@@ -3,6 +3,8 @@ Qt Theme - Modern Premium Design
 Inspired by modern desktop applications with enhanced visual appeal
 """
 
+from functools import lru_cache
+
 
 class AppColors:
     """
@@ -79,8 +81,9 @@ class AppTheme:
     """Theme generator"""
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_stylesheet() -> str:
-        """Main application stylesheet with modern premium design"""
+        """Main application stylesheet with modern premium design (cached)"""
         c = AppColors
 
         return f"""
@@ -236,6 +239,20 @@ class AppTheme:
             background-color: {c.PRIMARY_DARK};
         }}
         
+        /* Per-row delete button in tables */
+        QPushButton#rowDelete {{
+            background-color: transparent;
+            border: none;
+            font-size: 13px;
+            color: {c.ERROR_LIGHT};
+        }}
+        
+        QPushButton#rowDelete:hover {{
+            background-color: {c.ERROR_BG};
+            border: 1px solid {c.ERROR_LIGHT};
+            border-radius: 4px;
+        }}
+        
         /* ===== Inputs ===== */
         QLineEdit {{
             background-color: {c.SURFACE};
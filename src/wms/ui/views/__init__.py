@@ -1,17 +1,27 @@
 """
 Qt Views Package
+
+Views are imported on first access so that loading one page does not pull
+in the modules (and dependencies) of every other page.
 """
 
-from .calculation_view import CalculationView
-from .history_view import HistoryView
-from .product_view import ProductView
-from .settings_view import SettingsView
-from .stock_view import StockView
+from importlib import import_module
+
+_VIEW_MODULES = {
+    "CalculationView": ".calculation_view",
+    "StockView": ".stock_view",
+    "ProductView": ".product_view",
+    "HistoryView": ".history_view",
+    "SettingsView": ".settings_view",
+}
+
+__all__ = list(_VIEW_MODULES)
+
 
-__all__ = [
-    "CalculationView",
-    "StockView",
-    "ProductView",
-    "HistoryView",
-    "SettingsView",
-]
+def __getattr__(name):
+    module = _VIEW_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -15,13 +15,51 @@ from PyQt6.QtWidgets import (
 from ...database.repositories import BankRepository
 from ..theme import AppColors
 
+_SOURCE_ICONS = {
+    "MoMo": "💜", "VietinBank": "🏦", "Vietcombank": "🏦",
+    "MB Bank": "🏦", "BIDV": "🏦", "ACB": "🏦",
+    "TPBank": "🏦", "Techcombank": "🏦", "VNPay": "💳",
+}
+
 
 class BankView(QWidget):
     """View hiển thị lịch sử thông báo ngân hàng với sub-tabs"""
 
+    # Fonts/colors shared by every table item (built once, needs a QApplication)
+    _FONT_CELL = None
+    _FONT_SOURCE = None
+    _FONT_AMOUNT = None
+    _FONT_LOG = None
+    _FONT_LOG_BOLD = None
+    _FONT_LOG_MSG = None
+    _COLOR_SUCCESS = None
+    _COLOR_ERROR = None
+    _COLOR_INFO = None
+    _COLOR_TEXT = None
+    _COLOR_TEXT_SECONDARY = None
+
+    @classmethod
+    def _init_item_styles(cls):
+        if cls._FONT_CELL is not None:
+            return
+        cls._FONT_CELL = QFont("Roboto", 10)
+        cls._FONT_SOURCE = QFont("Roboto", 10, QFont.Weight.DemiBold)
+        cls._FONT_AMOUNT = QFont("Roboto", 11, QFont.Weight.Bold)
+        cls._FONT_LOG = QFont("Roboto", 9)
+        cls._FONT_LOG_BOLD = QFont("Roboto", 9, QFont.Weight.Bold)
+        cls._FONT_LOG_MSG = QFont("Roboto", 8)
+        cls._COLOR_SUCCESS = QColor(AppColors.SUCCESS)
+        cls._COLOR_ERROR = QColor(AppColors.ERROR)
+        cls._COLOR_INFO = QColor(AppColors.INFO)
+        cls._COLOR_TEXT = QColor(AppColors.TEXT)
+        cls._COLOR_TEXT_SECONDARY = QColor(AppColors.TEXT_SECONDARY)
+
     def __init__(self):
         super().__init__()
+        self._init_item_styles()
         self._data_loaded = False
+        # Bumped on every change to the transactions table (see QuickBankPeek)
+        self._generation = 0
         self._setup_ui()
 
     def showEvent(self, event):
@@ -220,11 +258,18 @@ class BankView(QWidget):
 
     def load_history(self):
         """Tải lại lịch sử từ database"""
-        notifs = BankRepository.get_all()
-        for n in reversed(notifs):
-            self._add_row_ui(
-                n.id, n.time_str, n.source, n.amount, n.sender_name or "", n.content
-            )
+        # Newest first, appended at the bottom (no per-row shift of insertRow(0))
+        self.table.setUpdatesEnabled(False)
+        try:
+            for db_id, time_str, source, amount, sender_name, content in (
+                BankRepository.get_recent(100)
+            ):
+                self._add_row_ui(
+                    db_id, time_str, source, amount, sender_name, content,
+                    row=self.table.rowCount(),
+                )
+        finally:
+            self.table.setUpdatesEnabled(True)
         self._update_total()
     
     def _update_total(self):
@@ -325,19 +370,19 @@ class BankView(QWidget):
 
         # Timestamp
         time_item = QTableWidgetItem(time_str)
-        time_item.setFont(QFont("Roboto", 9))
+        time_item.setFont(self._FONT_LOG)
         self.logs_table.setItem(row, 0, time_item)
 
         # System Label
         pkg_item = QTableWidgetItem("System")
-        pkg_item.setFont(QFont("Roboto", 9, QFont.Weight.Bold))
-        pkg_item.setForeground(QColor(AppColors.INFO))
+        pkg_item.setFont(self._FONT_LOG_BOLD)
+        pkg_item.setForeground(self._COLOR_INFO)
         self.logs_table.setItem(row, 1, pkg_item)
 
         # Message
         msg_item = QTableWidgetItem(message)
-        msg_item.setFont(QFont("Roboto", 9))
-        msg_item.setForeground(QColor(AppColors.TEXT))
+        msg_item.setFont(self._FONT_LOG)
+        msg_item.setForeground(self._COLOR_TEXT)
         self.logs_table.setItem(row, 2, msg_item)
         
         # Limit logs
@@ -351,19 +396,19 @@ class BankView(QWidget):
 
         # Timestamp
         time_item = QTableWidgetItem(time_str)
-        time_item.setFont(QFont("Roboto", 9))
+        time_item.setFont(self._FONT_LOG)
         self.logs_table.setItem(row, 0, time_item)
 
         # Package name
         pkg_item = QTableWidgetItem(package)
-        pkg_item.setFont(QFont("Roboto", 9))
-        pkg_item.setForeground(QColor(AppColors.TEXT_SECONDARY))
+        pkg_item.setFont(self._FONT_LOG)
+        pkg_item.setForeground(self._COLOR_TEXT_SECONDARY)
         self.logs_table.setItem(row, 1, pkg_item)
 
         # Raw message
         msg_item = QTableWidgetItem(raw_message)
-        msg_item.setFont(QFont("Roboto", 8))
-        msg_item.setForeground(QColor(AppColors.TEXT_SECONDARY))
+        msg_item.setFont(self._FONT_LOG_MSG)
+        msg_item.setForeground(self._COLOR_TEXT_SECONDARY)
         self.logs_table.setItem(row, 2, msg_item)
 
         # Limit logs to 100 rows
@@ -374,38 +419,31 @@ class BankView(QWidget):
         """Xóa tất cả raw logs"""
         self.logs_table.setRowCount(0)
 
-    def _add_row_ui(self, db_id, time_str, source, amount, sender_name, raw_message):
-        row = 0
+    def _add_row_ui(self, db_id, time_str, source, amount, sender_name, raw_message, row=0):
+        self._generation += 1
         self.table.insertRow(row)
 
         # Time column
         time_item = QTableWidgetItem(time_str)
-        time_item.setFont(QFont("Roboto", 10))
+        time_item.setFont(self._FONT_CELL)
         time_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
         self.table.setItem(row, 0, time_item)
 
         # Source column with bank icon
-        src_icons = {
-            "MoMo": "💜", "VietinBank": "🏦", "Vietcombank": "🏦",
-            "MB Bank": "🏦", "BIDV": "🏦", "ACB": "🏦",
-            "TPBank": "🏦", "Techcombank": "🏦", "VNPay": "💳",
-        }
-        icon = src_icons.get(source, "📱")
+        icon = _SOURCE_ICONS.get(source, "📱")
         src_item = QTableWidgetItem(f"{icon} {source}")
         src_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        src_item.setFont(QFont("Roboto", 10, QFont.Weight.DemiBold))
+        src_item.setFont(self._FONT_SOURCE)
         self.table.setItem(row, 1, src_item)
 
         # Amount column — bold, colored
         amt_display = amount if amount else "---"
         amt_item = QTableWidgetItem(amt_display)
-        if amount and amount.startswith("+"):
-            amt_item.setForeground(QColor(AppColors.SUCCESS))
-        elif amount and amount.startswith("-"):
-            amt_item.setForeground(QColor(AppColors.ERROR))
+        if amount and amount.startswith("-"):
+            amt_item.setForeground(self._COLOR_ERROR)
         else:
-            amt_item.setForeground(QColor(AppColors.SUCCESS))
-        amt_item.setFont(QFont("Roboto", 11, QFont.Weight.Bold))
+            amt_item.setForeground(self._COLOR_SUCCESS)
+        amt_item.setFont(self._FONT_AMOUNT)
         amt_item.setTextAlignment(
             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
         )
@@ -414,14 +452,14 @@ class BankView(QWidget):
         # Sender column — full text, tooltip for overflow
         sender_text = sender_name if sender_name else "---"
         sender_item = QTableWidgetItem(sender_text)
-        sender_item.setFont(QFont("Roboto", 10))
+        sender_item.setFont(self._FONT_CELL)
         sender_item.setToolTip(sender_text)
         self.table.setItem(row, 3, sender_item)
 
         # Details column — full content with tooltip
         detail_item = QTableWidgetItem(raw_message)
-        detail_item.setFont(QFont("Roboto", 10))
-        detail_item.setForeground(QColor(AppColors.TEXT_SECONDARY))
+        detail_item.setFont(self._FONT_CELL)
+        detail_item.setForeground(self._COLOR_TEXT_SECONDARY)
         detail_item.setToolTip(raw_message)
         self.table.setItem(row, 4, detail_item)
 
@@ -435,19 +473,7 @@ class BankView(QWidget):
         del_btn = QPushButton("✕")
         del_btn.setFixedSize(26, 26)
         del_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        del_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent; 
-                border: none; 
-                font-size: 13px; 
-                color: {AppColors.ERROR_LIGHT}; 
-            }}
-            QPushButton:hover {{
-                background-color: {AppColors.ERROR_BG};
-                border: 1px solid {AppColors.ERROR_LIGHT};
-                border-radius: 4px;
-            }}
-        """)
+        del_btn.setObjectName("rowDelete")  # Styled by AppTheme
         del_btn.clicked.connect(lambda: self._delete_row(db_id))
 
         del_layout.addWidget(del_btn)
@@ -469,12 +495,14 @@ class BankView(QWidget):
         if target_row != -1:
             BankRepository.delete(db_id)
             self.table.removeRow(target_row)
+            self._generation += 1
             self._update_total()
 
     def clear_history(self):
         """Xóa sạch bảng lịch sử"""
         BankRepository.clear_all()
         self.table.setRowCount(0)
+        self._generation += 1
         self._update_total()
 
     def cleanup(self):
@@ -482,6 +510,7 @@ class BankView(QWidget):
         # Clear tables
         self.table.setRowCount(0)
         self.logs_table.setRowCount(0)
+        self._generation += 1
         
         # Disconnect signals
         try:
@@ -27,6 +27,11 @@ class LoadingSpinner(QWidget):
         self.is_spinning = False
         
         self.setFixedSize(size, size)
+
+        # Arc pen is constant; build it once instead of every frame
+        self._pen = QPen(QColor(AppColors.INFO))
+        self._pen.setWidth(4)
+        self._pen.setCapStyle(Qt.PenCapStyle.RoundCap)
         
         # Timer for animation
         self.timer = QTimer(self)
@@ -63,10 +68,7 @@ class LoadingSpinner(QWidget):
         radius = min(self.width(), self.height()) // 2 - 5
         
         # Draw arcs
-        pen = QPen(QColor(AppColors.INFO))
-        pen.setWidth(4)
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        painter.setPen(pen)
+        painter.setPen(self._pen)
         
         # Rotate
         painter.translate(center_x, center_y)
@@ -15,12 +15,24 @@ from ..theme import AppColors
 class QuickBankPeek(QFrame):
     """Cửa sổ hiện nhanh lịch sử giao dịch khi nhấn giữ nút Ngân hàng"""
 
+    # Shared amount-column style (built once, needs a QApplication)
+    _AMOUNT_FONT = None
+    _COLOR_SUCCESS = None
+    _COLOR_ERROR = None
+
     def __init__(self, parent=None):
         super().__init__(parent, Qt.WindowType.ToolTip)
+        if QuickBankPeek._AMOUNT_FONT is None:
+            QuickBankPeek._AMOUNT_FONT = QFont("Roboto", 10, QFont.Weight.Bold)
+            QuickBankPeek._COLOR_SUCCESS = QColor(AppColors.SUCCESS)
+            QuickBankPeek._COLOR_ERROR = QColor(AppColors.ERROR)
         self.setObjectName("card")
         self.setFixedWidth(350)
         self.setMinimumHeight(400)
 
+        # BankView generation last copied into the table
+        self._last_gen = -1
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
 
@@ -64,8 +76,14 @@ class QuickBankPeek(QFrame):
         )
         layout.addWidget(hint)
 
-    def update_data(self, bank_view_table):
+    def update_data(self, bank_view):
         """Đồng bộ dữ liệu từ bảng chính sang bảng xem nhanh"""
+        # Skip the rebuild when the bank table hasn't changed since last time
+        if bank_view._generation == self._last_gen:
+            return
+        self._last_gen = bank_view._generation
+
+        bank_view_table = bank_view.table
         rows = min(bank_view_table.rowCount(), 15)
         self.table.setRowCount(rows)
         for r in range(rows):
@@ -77,14 +95,12 @@ class QuickBankPeek(QFrame):
             amt_text = bank_view_table.item(r, 2).text()
             amt_item = QTableWidgetItem(amt_text)
 
-            if amt_text.startswith("+"):
-                amt_item.setForeground(QColor(AppColors.SUCCESS))
-            elif amt_text.startswith("-"):
-                amt_item.setForeground(QColor(AppColors.ERROR))
+            if amt_text.startswith("-"):
+                amt_item.setForeground(self._COLOR_ERROR)
             else:
-                amt_item.setForeground(QColor(AppColors.SUCCESS))
+                amt_item.setForeground(self._COLOR_SUCCESS)
 
-            amt_item.setFont(QFont("Roboto", 10, QFont.Weight.Bold))
+            amt_item.setFont(self._AMOUNT_FONT)
             self.table.setItem(r, 1, amt_item)
 
             self.table.setItem(
@@ -94,3 +110,4 @@ class QuickBankPeek(QFrame):
     def cleanup(self):
         """Cleanup resources"""
         self.table.setRowCount(0)
+        self._last_gen = -1
@@ -35,25 +35,31 @@ class StatusDot(QWidget):
 
     def __init__(self, size=8, parent=None):
         super().__init__(parent)
-        self._color = QColor(AppColors.SUCCESS)
         self._size = size
         self.setFixedSize(size + 4, size + 4)
+        self._set_brushes(AppColors.SUCCESS)
 
-    def set_color(self, color: str):
+    def _set_brushes(self, color: str):
+        """Build dot and glow brushes once per color, not per paint"""
         self._color = QColor(color)
+        glow = QColor(self._color)
+        glow.setAlpha(60)
+        self._glow_brush = QBrush(glow)
+        self._dot_brush = QBrush(self._color)
+
+    def set_color(self, color: str):
+        self._set_brushes(color)
         self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         # Glow
-        glow = QColor(self._color)
-        glow.setAlpha(60)
-        painter.setBrush(QBrush(glow))
+        painter.setBrush(self._glow_brush)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(0, 0, self._size + 4, self._size + 4)
         # Dot
-        painter.setBrush(QBrush(self._color))
+        painter.setBrush(self._dot_brush)
         painter.drawEllipse(2, 2, self._size, self._size)
         painter.end()
 
@@ -3,6 +3,8 @@ Unit tests cho database repositories
 """
 
 import os
+import sqlite3
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -11,8 +13,13 @@ from wms.core import config
 
 config.DB_PATH = Path(__file__).parent / "test_storage.db"
 
-from wms.database.connection import init_db
-from wms.database.repositories import ProductRepository, SessionRepository
+from wms.database.connection import init_db, init_db_async, wait_ready
+from wms.database.migrations import Migration, MigrationManager
+from wms.database.repositories import (
+    BankRepository,
+    ProductRepository,
+    SessionRepository,
+)
 
 
 class TestProductRepository(unittest.TestCase):
@@ -121,6 +128,21 @@ class TestSessionRepository(unittest.TestCase):
             self.assertEqual(updated.closing_qty, 50)
             self.assertEqual(updated.used_qty, 50)
 
+    def test_update_qty_bulk(self):
+        """Test cập nhật nhiều sản phẩm trong một lần"""
+        ids = [ProductRepository.add(f"Bulk {i}", "Thùng", 24, 1000) for i in range(2)]
+        self.assertEqual(SessionRepository.update_qty_bulk([]), 0)
+        self.assertEqual(
+            SessionRepository.update_qty_bulk([(ids[0], 10, 4), (ids[1], 6, 0)]), 2
+        )
+        sessions = {s.product.id: s for s in SessionRepository.get_all()}
+        self.assertEqual(
+            (sessions[ids[0]].handover_qty, sessions[ids[0]].closing_qty), (10, 4)
+        )
+        self.assertEqual(
+            (sessions[ids[1]].handover_qty, sessions[ids[1]].closing_qty), (6, 0)
+        )
+
     def test_reset_all(self):
         """Test reset tất cả số lượng"""
         result = SessionRepository.reset_all()
@@ -138,5 +160,101 @@ class TestSessionRepository(unittest.TestCase):
         self.assertGreaterEqual(total, 0)
 
 
+class TestBankRepository(unittest.TestCase):
+    """Test cases cho BankRepository"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Setup"""
+        if not config.DB_PATH.exists():
+            init_db()
+
+    def test_get_recent_newest_first(self):
+        """Test get_recent trả về dòng mới nhất trước, có giới hạn"""
+        ids = [
+            BankRepository.add("08:00:00", "MoMo", "+10,000 VND", "a", "A"),
+            BankRepository.add("08:01:00", "ACB", "+20,000 VND", "b"),
+            BankRepository.add("08:02:00", "BIDV", "-5,000 VND", "c", "C"),
+        ]
+        try:
+            rows = BankRepository.get_recent(2)
+            self.assertEqual([r[0] for r in rows], [ids[2], ids[1]])
+            self.assertEqual(
+                rows[0], (ids[2], "08:02:00", "BIDV", "-5,000 VND", "C", "c")
+            )
+            self.assertEqual(rows[1][4], "")
+        finally:
+            for bank_id in ids:
+                BankRepository.delete(bank_id)
+
+
+class TestInitDbAsync(unittest.TestCase):
+    """Test cases cho init_db_async / wait_ready"""
+
+    def test_queries_wait_for_background_init(self):
+        """Test truy vấn chờ schema khởi tạo xong"""
+        calls = []
+        init_db_async(after=lambda: calls.append("after"))
+        products = ProductRepository.get_all()
+        self.assertEqual(calls, ["after"])
+        self.assertIsInstance(products, list)
+        self.assertTrue(wait_ready())
+
+    def test_init_error_is_reraised(self):
+        """Test lỗi khởi tạo được raise lại khi chờ"""
+
+        def fail():
+            raise RuntimeError("boom")
+
+        init_db_async(after=fail)
+        with self.assertRaises(RuntimeError):
+            wait_ready()
+        init_db_async().join()
+        self.assertTrue(wait_ready())
+
+
+class _CreateTableMigration(Migration):
+    version = 1
+    description = "Create t"
+
+    def up(self, conn):
+        conn.execute("CREATE TABLE t (id INTEGER)")
+
+    def down(self, conn):
+        conn.execute("DROP TABLE t")
+
+
+class TestMigrationManager(unittest.TestCase):
+    """Test cases cho MigrationManager"""
+
+    def setUp(self):
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.db_path = Path(path)
+        self.addCleanup(self.db_path.unlink)
+
+    def _tables(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            return {name for (name,) in rows}
+        finally:
+            conn.close()
+
+    def test_version_probe_is_read_only(self):
+        """Test đọc version không tạo bảng schema_version"""
+        manager = MigrationManager(self.db_path, migrations=[])
+        self.assertEqual(manager.get_current_version(), 0)
+        manager.migrate()
+        self.assertEqual(self._tables(), set())
+
+    def test_migrate_records_version(self):
+        """Test migrate áp dụng migration và ghi version"""
+        manager = MigrationManager(self.db_path, migrations=[_CreateTableMigration()])
+        manager.migrate()
+        self.assertEqual(manager.get_current_version(), 1)
+        self.assertEqual(self._tables(), {"schema_version", "t"})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,296 @@
+"""
+Integration tests cho NotificationHandler (HTTP server nhận thông báo)
+"""
+
+import json
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from unittest import mock
+from wms.network.notification_handler import (NotificationHandler,
+                                              NotificationHTTPServer,
+                                              _extract_content, _query_value)
+
+SECRET = "test-secret-key"
+
+
+class _Signal:
+    """Thay thế pyqtSignal: ghi lại các message được emit"""
+
+    def __init__(self):
+        self.messages = []
+
+    def emit(self, msg):
+        self.messages.append(msg)
+
+
+class TestNotificationHandler(unittest.TestCase):
+    """Test cases cho NotificationHandler"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = NotificationHTTPServer(("127.0.0.1", 0), NotificationHandler)
+        cls.server.signal = _Signal()
+        cls.server.secret_key = SECRET
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.signal.messages.clear()
+
+    def _request(self, path, body=None, headers=None):
+        req = urllib.request.Request(
+            self.base_url + path, data=body, headers=headers or {}
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=5) as resp:
+                return resp.status, json.loads(resp.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def _post_json(self, payload, key=SECRET):
+        headers = {"Content-Type": "application/json"}
+        if key is not None:
+            headers["Authorization"] = f"Bearer {key}"
+        return self._request("/", json.dumps(payload).encode("utf-8"), headers)
+
+    def test_health_needs_no_auth(self):
+        """Test GET /health không cần key"""
+        status, body = self._request("/health")
+        self.assertEqual(status, 200)
+        self.assertEqual(body["status"], "ok")
+
+    def test_missing_key_rejected(self):
+        """Test thiếu key trả về 401"""
+        status, _ = self._post_json({"content": "x"}, key=None)
+        self.assertEqual(status, 401)
+        self.assertEqual(self.server.signal.messages, [])
+
+    def test_wrong_key_rejected(self):
+        """Test sai key trả về 403"""
+        status, _ = self._post_json({"content": "x"}, key="wrong-key")
+        self.assertEqual(status, 403)
+        self.assertEqual(self.server.signal.messages, [])
+
+    def test_api_requires_key(self):
+        """Test /api/* không có hoặc sai key đều trả về 401"""
+        for path, body, key in (
+            ("/api/session", None, None),
+            ("/api/session/", None, None),
+            ("/api/notes", b"{}", "wrong-key"),
+        ):
+            headers = {"Authorization": f"Bearer {key}"} if key else {}
+            status, resp = self._request(path, body, headers)
+            self.assertEqual(status, 401)
+            self.assertFalse(resp["success"])
+
+    def test_bank_notification_emitted(self):
+        """Test thông báo ngân hàng được đẩy lên UI"""
+        inner = json.dumps({"package": "com.mbmobile", "content": "+5,000 VND"})
+        status, body = self._post_json({"content": inner})
+        self.assertEqual(status, 200)
+        self.assertEqual(body["message"], "received")
+        self.assertEqual(self.server.signal.messages, ["+5,000 VND"])
+
+    def test_non_bank_package_filtered(self):
+        """Test thông báo từ app không phải ngân hàng bị lọc"""
+        inner = json.dumps({"package": "com.example.chat", "content": "hi"})
+        status, body = self._post_json({"content": inner})
+        self.assertEqual(status, 200)
+        self.assertEqual(body["message"], "filtered")
+        self.assertEqual(self.server.signal.messages, [])
+
+    def test_top_level_package_without_content(self):
+        """Test body có package nhưng không có content vẫn được lọc"""
+        status, body = self._post_json({"package": "com.example.chat", "title": "hi"})
+        self.assertEqual(status, 200)
+        self.assertEqual(body["message"], "filtered")
+
+    def test_oversized_body_rejected(self):
+        """Test body quá lớn trả về 413 mà không đọc/parse"""
+        status, _ = self._post_json({"content": "x" * (70 * 1024)})
+        self.assertEqual(status, 413)
+        self.assertEqual(self.server.signal.messages, [])
+
+    def test_error_body_is_valid_json(self):
+        """Test lỗi 500 trả về JSON hợp lệ dù message có dấu ngoặc kép"""
+        signal = self.server.signal
+
+        class _Broken:
+            def emit(self, msg):
+                raise RuntimeError('bad "quote"\nline')
+
+        self.server.signal = _Broken()
+        try:
+            status, body = self._post_json({"content": "x"})
+        finally:
+            self.server.signal = signal
+        self.assertEqual(status, 500)
+        self.assertEqual(body["message"], 'bad "quote"\nline')
+
+    def test_non_string_content_without_orjson(self):
+        """Test content không phải chuỗi vẫn được xử lý khi dùng json chuẩn"""
+        with mock.patch("wms.network.notification_handler._loads", json.loads):
+            for content in (123, {"a": 1}, ["x"]):
+                status, body = self._post_json({"content": content})
+                self.assertEqual(status, 200)
+                self.assertEqual(body["message"], "received")
+        self.assertEqual(len(self.server.signal.messages), 3)
+
+    def test_form_content(self):
+        """Test lấy content từ form data"""
+        status, _ = self._request(
+            "/",
+            b"content=%2B5%2C000+VND&x=1",
+            {
+                "Authorization": f"Bearer {SECRET}",
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(self.server.signal.messages, ["+5,000 VND"])
+
+    def test_query_content(self):
+        """Test lấy content từ query string"""
+        status, _ = self._request(
+            "/notify?content=hello%20world",
+            headers={"Authorization": f"Bearer {SECRET}"},
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(self.server.signal.messages, ["hello world"])
+
+
+class TestRateLimitStore(unittest.TestCase):
+    """Test cases cho bộ nhớ rate limit"""
+
+    def test_store_is_bounded_lru(self):
+        """Test store giới hạn số IP và loại IP ít dùng nhất"""
+        handler = NotificationHandler.__new__(NotificationHandler)
+        handler.server = NotificationHTTPServer.__new__(NotificationHTTPServer)
+        store = NotificationHandler._rate_limit_store
+        saved = dict(store)
+        store.clear()
+        try:
+            with mock.patch.object(NotificationHandler, "RATE_LIMIT_MAX_KEYS", 2):
+                for ip in ("10.0.0.1", "10.0.0.2", "10.0.0.1", "10.0.0.3"):
+                    self.assertTrue(handler._check_rate_limit(ip))
+            self.assertEqual(list(store), ["10.0.0.1", "10.0.0.3"])
+        finally:
+            store.clear()
+            store.update(saved)
+
+
+class TestNotificationHTTPServer(unittest.TestCase):
+    """Test cases cho NotificationHTTPServer"""
+
+    def test_rate_limit_token_bucket(self):
+        """Test vượt quá số token thì trả về 429"""
+        store = NotificationHandler._rate_limit_store
+        server = NotificationHTTPServer(("127.0.0.1", 0), NotificationHandler)
+        server.rate_limit_max = 2
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/health"
+        statuses = []
+        store.pop("127.0.0.1", None)
+        try:
+            for _ in range(3):
+                try:
+                    with urllib.request.urlopen(url, timeout=5) as resp:
+                        statuses.append(resp.status)
+                except urllib.error.HTTPError as e:
+                    statuses.append(e.code)
+            self.assertEqual(statuses, [200, 200, 429])
+        finally:
+            store.pop("127.0.0.1", None)
+            server.shutdown()
+            server.server_close()
+
+    def test_requests_handled_concurrently(self):
+        """Test hai request được xử lý song song trên các thread riêng"""
+        barrier = threading.Barrier(2, timeout=5)
+
+        class _WaitSignal:
+            def emit(self, msg):
+                # Chỉ qua được khi request thứ hai cũng đang được xử lý
+                barrier.wait()
+
+        server = NotificationHTTPServer(("127.0.0.1", 0), NotificationHandler)
+        server.signal = _WaitSignal()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/notify?content=x"
+        statuses = []
+
+        def fetch():
+            with urllib.request.urlopen(url, timeout=10) as resp:
+                statuses.append(resp.status)
+
+        try:
+            clients = [threading.Thread(target=fetch) for _ in range(2)]
+            for client in clients:
+                client.start()
+            for client in clients:
+                client.join()
+            self.assertEqual(statuses, [200, 200])
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_secret_key_caches_bytes(self):
+        """Test đặt secret_key thì bật auth và lưu sẵn bytes"""
+        server = NotificationHTTPServer(("127.0.0.1", 0), NotificationHandler)
+        try:
+            self.assertFalse(server.auth_enabled)
+            server.secret_key = "abc"
+            self.assertTrue(server.auth_enabled)
+            self.assertEqual(server.secret_key_bytes, b"abc")
+            server.secret_key = ""
+            self.assertFalse(server.auth_enabled)
+            self.assertIsNone(server.secret_key_bytes)
+        finally:
+            server.server_close()
+
+
+class TestQueryValue(unittest.TestCase):
+    """Test cases cho _query_value"""
+
+    def test_matches_parse_qs(self):
+        """Test kết quả giống parse_qs()[name][0]"""
+        query = "x=1&content=a%20b+c&content=second"
+        self.assertEqual(_query_value(query, "content"), "a b c")
+        self.assertEqual(_query_value(query, "x"), "1")
+
+    def test_missing_or_blank(self):
+        """Test không có giá trị hoặc giá trị rỗng"""
+        self.assertIsNone(_query_value("content=&x=1", "content"))
+        self.assertIsNone(_query_value("contents=1", "content"))
+        self.assertEqual(_query_value("content=&content=z", "content"), "z")
+
+
+class TestExtractContent(unittest.TestCase):
+    """Test cases cho _extract_content"""
+
+    def test_plain_and_nested_content(self):
+        """Test content thường và content là chuỗi JSON lồng nhau"""
+        self.assertEqual(_extract_content({"content": "+5,000 VND"}, "raw"), "+5,000 VND")
+        nested = {"content": ' {"content": "inner"}'}
+        self.assertEqual(_extract_content(nested, "raw"), "inner")
+
+    def test_fallbacks(self):
+        """Test JSON hỏng, không phải dict hoặc thiếu content"""
+        self.assertEqual(_extract_content({"content": "{oops"}, "raw"), "{oops")
+        self.assertEqual(_extract_content({"content": "[1, 2]"}, "raw"), "[1, 2]")
+        self.assertEqual(_extract_content({"title": "x"}, "raw"), "raw")
+        self.assertEqual(_extract_content(None, "raw"), "raw")
+
+
+if __name__ == "__main__":
+    unittest.main()
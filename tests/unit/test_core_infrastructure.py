@@ -106,6 +106,17 @@ class TestContainer:
         retrieved = container.get("test_service")
         assert retrieved is test_service
 
+    def test_register_many(self):
+        """Test registering several singleton services at once"""
+        config = Config.from_env()
+        container = Container(config)
+
+        first, second = Mock(), Mock()
+        container.register_many({"first": first, "second": second})
+
+        assert container.get("first") is first
+        assert container.get("second") is second
+
     def test_register_and_get_factory(self):
         """Test registering and retrieving factory services"""
         config = Config.from_env()